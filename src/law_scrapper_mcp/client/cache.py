@@ -3,6 +3,8 @@
 from __future__ import annotations
 
 import asyncio
+import heapq
+import itertools
 import time
 from dataclasses import dataclass
 from typing import Any, Generic, TypeVar
@@ -24,6 +26,7 @@ class TTLCache:
 
     def __init__(self, max_entries: int = 1000):
         self._cache: dict[str, CacheEntry[Any]] = {}
+        self._expiry_heap: list[tuple[float, str]] = []
         self._max_entries = max_entries
         self._lock = asyncio.Lock()
 
@@ -44,7 +47,11 @@ class TTLCache:
         """Set value in cache with TTL."""
         async with self._lock:
             now = time.time()
-            self._cache[key] = CacheEntry(value=value, expires_at=now + ttl, created_at=now)
+            expires_at = now + ttl
+            # Re-insert so dict order stays creation order (oldest first) for LRU eviction
+            self._cache.pop(key, None)
+            self._cache[key] = CacheEntry(value=value, expires_at=expires_at, created_at=now)
+            heapq.heappush(self._expiry_heap, (expires_at, key))
 
             # Evict if over capacity
             if len(self._cache) > self._max_entries:
@@ -52,6 +59,11 @@ class TTLCache:
                 if len(self._cache) > self._max_entries:
                     self._evict_lru()
 
+            # Drop stale heap entries left behind by overwrites and deletes
+            if len(self._expiry_heap) > 2 * self._max_entries:
+                self._expiry_heap = [(e.expires_at, k) for k, e in self._cache.items()]
+                heapq.heapify(self._expiry_heap)
+
     async def delete(self, key: str) -> None:
         """Delete entry from cache."""
         async with self._lock:
@@ -61,20 +73,24 @@ class TTLCache:
         """Clear all entries from cache."""
         async with self._lock:
             self._cache.clear()
+            self._expiry_heap.clear()
 
     def _evict_expired(self) -> None:
         """Remove all expired entries (called under lock)."""
         now = time.time()
-        expired_keys = [k for k, v in self._cache.items() if now > v.expires_at]
-        for key in expired_keys:
-            del self._cache[key]
+        heap = self._expiry_heap
+        while heap and heap[0][0] < now:
+            expires_at, key = heapq.heappop(heap)
+            entry = self._cache.get(key)
+            # Skip heap entries for keys that were since overwritten or deleted
+            if entry is not None and entry.expires_at == expires_at:
+                del self._cache[key]
 
     def _evict_lru(self) -> None:
         """Remove least recently used entries (called under lock)."""
-        # Sort by creation time and remove oldest 10%
-        sorted_items = sorted(self._cache.items(), key=lambda x: x[1].created_at)
+        # Dict order is creation order, so the oldest 10% come first
         num_to_remove = max(1, len(self._cache) // 10)
-        for key, _ in sorted_items[:num_to_remove]:
+        for key in list(itertools.islice(self._cache, num_to_remove)):
             del self._cache[key]
 
     @property
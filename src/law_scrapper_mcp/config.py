@@ -35,6 +35,9 @@ class Settings(BaseSettings):
     doc_store_max_size_bytes: int = 5 * 1024 * 1024
     doc_store_ttl: int = 7200
 
+    # Result Store
+    result_store_min_results: int = 2
+
     # Circuit breaker
     circuit_breaker_threshold: int = 5
     circuit_breaker_recovery_timeout: float = 60.0
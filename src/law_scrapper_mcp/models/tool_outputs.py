@@ -4,7 +4,7 @@ from __future__ import annotations
 
 from typing import Any, Generic, TypeVar
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 T = TypeVar("T")
 
@@ -12,6 +12,8 @@ T = TypeVar("T")
 class Hint(BaseModel):
     """Hint for next actions or related tools."""
 
+    model_config = ConfigDict(frozen=True)
+
     message: str = Field(description="Hint message")
     tool: str | None = Field(default=None, description="Related tool name")
     parameters: dict[str, Any] | None = Field(default=None, description="Suggested parameters")
@@ -93,6 +95,7 @@ class SearchInActOutput(BaseModel):
     query: str
     matches: list[dict[str, Any]]
     total_matches: int
+    truncated: bool = False
 
 
 class MetadataOutput(BaseModel):
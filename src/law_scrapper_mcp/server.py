@@ -51,7 +51,7 @@ async def lifespan(server):
     )
     content_processor = ContentProcessor()
 
-    result_store = ResultStore()
+    result_store = ResultStore(min_results=settings.result_store_min_results)
     metadata_service = MetadataService(client)
     search_service = SearchService(client)
     act_service = ActService(client, document_store, content_processor)
@@ -7,7 +7,7 @@ from dataclasses import dataclass
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Section:
     """Represents a section in a legal document."""
 
@@ -1,16 +1,25 @@
 """In-memory document store for loaded legal acts with section-level access."""
 
 import asyncio
+import bisect
+import itertools
 import logging
+import operator
 import re
 import time
+from collections.abc import Iterator
 from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any
 
 from law_scrapper_mcp.client.exceptions import DocumentNotLoadedError
 from law_scrapper_mcp.services.content_processor import Section
 
 logger = logging.getLogger(__name__)
 
+_ART_QUERY_RE = re.compile(r"art\.?\s*(\d+[a-z]?)", re.IGNORECASE)
+_ART_TITLE_RE = re.compile(r"Art\.?\s*(\d+[a-z]?)", re.IGNORECASE)
+
 
 @dataclass
 class LoadedDocument:
@@ -22,9 +31,65 @@ class LoadedDocument:
     loaded_at: float = field(default_factory=time.time)
     last_accessed: float = field(default_factory=time.time)
     size_bytes: int = 0
+    id_index: dict[str, int] = field(init=False, repr=False)
+    sorted_titles: list[tuple[str, int]] = field(init=False, repr=False)
+    art_index: dict[str, Section] = field(init=False, repr=False)
+    markdown_lower: str = field(init=False, repr=False)
+    section_starts: list[int] = field(init=False, repr=False)
+    sections_by_start: list[Section] = field(init=False, repr=False)
+    toc_entries: tuple[dict[str, Any], ...] = field(init=False, repr=False)
 
     def __post_init__(self):
-        self.size_bytes = len(self.markdown.encode("utf-8"))
+        if not self.size_bytes:
+            self.size_bytes = len(self.markdown.encode("utf-8"))
+        self.markdown_lower = self.markdown.lower()
+        # Lookup indexes for get_section (first section wins on duplicate keys)
+        self.id_index = {}
+        self.art_index = {}
+        for order, section in enumerate(self.sections):
+            self.id_index.setdefault(section.id.lower(), order)
+            if art_match := _ART_TITLE_RE.match(section.title):
+                self.art_index.setdefault(art_match.group(1).lower(), section)
+
+        # Lowercased titles in sorted order, tagged with document order, for prefix lookups
+        self.sorted_titles = sorted((s.title.lower(), order) for order, s in enumerate(self.sections))
+
+        # Sorted section starts for bisecting match positions (first section wins on equal starts)
+        self.section_starts = []
+        self.sections_by_start = []
+        for section in sorted(self.sections, key=operator.attrgetter("start_pos")):
+            if not self.section_starts or self.section_starts[-1] != section.start_pos:
+                self.section_starts.append(section.start_pos)
+                self.sections_by_start.append(section)
+
+        # TOC rows are immutable for the document's lifetime, so build them once
+        self.toc_entries = tuple({"id": s.id, "title": s.title, "level": s.level} for s in self.sections)
+
+    def find_section(self, query: str) -> Section | None:
+        """Return the first section (in document order) whose id equals query or whose title starts with it.
+
+        The query is expected lowercased; spaces match underscores in ids.
+        """
+        orders = []
+        if (id_order := self.id_index.get(query.replace(" ", "_"))) is not None:
+            orders.append(id_order)
+        titles = self.sorted_titles
+        for i in range(bisect.bisect_left(titles, (query,)), len(titles)):
+            title, order = titles[i]
+            if not title.startswith(query):
+                break
+            orders.append(order)
+        return self.sections[min(orders)] if orders else None
+
+    def section_at(self, pos: int) -> Section | None:
+        """Return the section containing the given markdown offset, if any."""
+        idx = bisect.bisect_right(self.section_starts, pos) - 1
+        if idx < 0:
+            return None
+        section = self.sections_by_start[idx]
+        if pos < (section.end_pos or len(self.markdown)):
+            return section
+        return None
 
 
 @dataclass
@@ -47,6 +112,7 @@ class DocumentStore:
         max_size_bytes: int = 5 * 1024 * 1024,
         ttl: int = 7200,
     ):
+        # Kept in recency order: the first entry is the least recently used
         self._store: dict[str, LoadedDocument] = {}
         self._max_documents = max_documents
         self._max_size_bytes = max_size_bytes
@@ -63,70 +129,76 @@ class DocumentStore:
                 markdown = markdown[: self._max_size_bytes]
                 # Re-index sections for truncated content
                 sections = [s for s in sections if s.start_pos < len(markdown)]
+                doc_size = len(markdown.encode("utf-8"))
 
-            self._evict_expired()
+            now = time.time()
+            self._evict_expired(now)
 
             if len(self._store) >= self._max_documents and eli not in self._store:
                 self._evict_lru()
 
-            self._store[eli] = LoadedDocument(eli=eli, markdown=markdown, sections=sections)
+            doc = LoadedDocument(
+                eli=eli, markdown=markdown, sections=sections, loaded_at=now, last_accessed=now, size_bytes=doc_size
+            )
+            self._store.pop(eli, None)
+            self._store[eli] = doc
             logger.info(f"Loaded document {eli} ({doc_size} bytes, {len(sections)} sections)")
 
     async def get_section(self, eli: str, section_id: str) -> str | None:
         """Get content of a specific section."""
         async with self._lock:
-            doc = self._get_doc(eli)
-            doc.last_accessed = time.time()
+            now = time.time()
+            doc = self._get_doc(eli, now)
+            self._touch(doc, now)
 
-            # Find section by ID (case-insensitive, flexible matching)
-            section_id_lower = section_id.lower().replace(" ", "_")
-            for section in doc.sections:
-                if section.id.lower() == section_id_lower or section.title.lower().startswith(section_id.lower()):
-                    return section.content
+            # Find section by ID or title prefix (case-insensitive), whichever comes first in the document
+            section = doc.find_section(section_id.lower())
 
             # Try matching by "Art. X" pattern
-            art_match = re.match(r"art\.?\s*(\d+[a-z]?)", section_id, re.IGNORECASE)
-            if art_match:
-                art_num = art_match.group(1)
-                for section in doc.sections:
-                    if re.match(rf"Art\.?\s*{re.escape(art_num)}", section.title, re.IGNORECASE):
-                        return section.content
+            if section is None:
+                art_match = _ART_QUERY_RE.match(section_id)
+                if art_match:
+                    section = doc.art_index.get(art_match.group(1).lower())
 
-            return None
+            return section.content if section is not None else None
 
-    async def search(self, eli: str, query: str, context_chars: int = 500) -> list[SearchHit]:
-        """Search within a loaded document."""
+    async def search(
+        self,
+        eli: str,
+        query: str,
+        context_chars: int = 500,
+        max_hits: int = 200,
+    ) -> list[SearchHit]:
+        """Search within a loaded document, returning at most max_hits hits."""
         async with self._lock:
-            doc = self._get_doc(eli)
-            doc.last_accessed = time.time()
+            now = time.time()
+            doc = self._get_doc(eli, now)
+            self._touch(doc, now)
 
             hits = []
-            try:
-                pattern = re.compile(re.escape(query), re.IGNORECASE)
-            except re.error:
+            needle = query.lower()
+            spans: Iterator[tuple[int, int]]
+            # Lowercasing keeps offsets aligned unless it changed the text length
+            if needle and len(doc.markdown_lower) == len(doc.markdown):
+                spans = _find_all(doc.markdown_lower, needle)
+            else:
                 pattern = re.compile(re.escape(query), re.IGNORECASE)
+                spans = (match.span() for match in pattern.finditer(doc.markdown))
 
-            for match in pattern.finditer(doc.markdown):
-                start = max(0, match.start() - context_chars)
-                end = min(len(doc.markdown), match.end() + context_chars)
-                context = doc.markdown[start:end]
-
-                # Find which section this match belongs to
-                section_id = "unknown"
-                section_title = "Unknown section"
-                for section in doc.sections:
-                    if section.start_pos <= match.start() < (section.end_pos or len(doc.markdown)):
-                        section_id = section.id
-                        section_title = section.title
-                        break
+            markdown = doc.markdown
+            section_at = doc.section_at
+            for match_start, match_end in itertools.islice(spans, max_hits):
+                # Slicing clamps the upper bound to the text length on its own
+                context = markdown[max(0, match_start - context_chars) : match_end + context_chars]
 
+                section = section_at(match_start)
                 hits.append(
                     SearchHit(
-                        section_id=section_id,
-                        section_title=section_title,
+                        section_id=section.id if section else "unknown",
+                        section_title=section.title if section else "Unknown section",
                         context=context,
-                        match_start=match.start(),
-                        match_end=match.end(),
+                        match_start=match_start,
+                        match_end=match_end,
                     )
                 )
 
@@ -135,10 +207,20 @@ class DocumentStore:
     async def get_toc(self, eli: str) -> list[Section]:
         """Get table of contents for a loaded document."""
         async with self._lock:
-            doc = self._get_doc(eli)
-            doc.last_accessed = time.time()
+            now = time.time()
+            doc = self._get_doc(eli, now)
+            self._touch(doc, now)
             return doc.sections
 
+    async def get_toc_entries(self, eli: str) -> list[dict[str, Any]]:
+        """Get table of contents as id/title/level dicts for a loaded document."""
+        async with self._lock:
+            now = time.time()
+            doc = self._get_doc(eli, now)
+            self._touch(doc, now)
+            # Copy the rows so callers cannot change the cached TOC in place
+            return [dict(entry) for entry in doc.toc_entries]
+
     async def is_loaded(self, eli: str) -> bool:
         """Check if a document is loaded."""
         async with self._lock:
@@ -153,14 +235,14 @@ class DocumentStore:
     async def list_documents(self) -> list[dict[str, object]]:
         """List all loaded documents with metadata."""
         async with self._lock:
-            self._evict_expired()
+            self._evict_expired(time.time())
             return [
                 {
                     "eli": doc.eli,
                     "size_bytes": doc.size_bytes,
                     "section_count": len(doc.sections),
-                    "loaded_at": time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(doc.loaded_at)),
-                    "last_accessed": time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(doc.last_accessed)),
+                    "loaded_at": _format_timestamp(doc.loaded_at),
+                    "last_accessed": _format_timestamp(doc.last_accessed),
                 }
                 for doc in self._store.values()
             ]
@@ -170,27 +252,47 @@ class DocumentStore:
         async with self._lock:
             self._store.pop(eli, None)
 
-    def _get_doc(self, eli: str) -> LoadedDocument:
+    def _get_doc(self, eli: str, now: float) -> LoadedDocument:
         """Get document or raise error (must be called under lock)."""
         if eli not in self._store:
             raise DocumentNotLoadedError(eli)
         doc = self._store[eli]
-        if time.time() - doc.last_accessed > self._ttl:
+        if now - doc.last_accessed > self._ttl:
             del self._store[eli]
             raise DocumentNotLoadedError(eli)
         return doc
 
-    def _evict_expired(self) -> None:
+    def _touch(self, doc: LoadedDocument, now: float) -> None:
+        """Record an access for TTL and LRU bookkeeping (called under lock)."""
+        doc.last_accessed = now
+        # Re-insert so the dict stays ordered from least to most recently used
+        self._store[doc.eli] = self._store.pop(doc.eli)
+
+    def _evict_expired(self, now: float) -> None:
         """Remove expired documents (called under lock)."""
-        now = time.time()
-        expired = [k for k, v in self._store.items() if now - v.last_accessed > self._ttl]
+        # The store is in recency order, so expired documents form a prefix of it
+        expired = list(itertools.takewhile(lambda k: now - self._store[k].last_accessed > self._ttl, self._store))
         for key in expired:
             del self._store[key]
 
     def _evict_lru(self) -> None:
         """Remove least recently used document (called under lock)."""
-        if not self._store:
+        lru_eli = next(iter(self._store), None)
+        if lru_eli is None:
             return
-        lru_key = min(self._store, key=lambda k: self._store[k].last_accessed)
-        logger.info(f"Evicting LRU document: {lru_key}")
-        del self._store[lru_key]
+        logger.info(f"Evicting LRU document: {lru_eli}")
+        del self._store[lru_eli]
+
+
+def _format_timestamp(timestamp: float) -> str:
+    """Format a Unix timestamp as local 'YYYY-MM-DD HH:MM:SS'."""
+    return datetime.fromtimestamp(timestamp).isoformat(sep=" ", timespec="seconds")
+
+
+def _find_all(haystack: str, needle: str) -> Iterator[tuple[int, int]]:
+    """Yield (start, end) spans of non-overlapping occurrences of needle."""
+    pos = haystack.find(needle)
+    while pos >= 0:
+        end = pos + len(needle)
+        yield pos, end
+        pos = haystack.find(needle, end)
@@ -4,6 +4,51 @@ from __future__ import annotations
 
 from law_scrapper_mcp.models.tool_outputs import Hint
 
+# Static hints are shared between responses (Hint is frozen)
+_HINT_PAGINATION = Hint(
+    message="Użyj parametrów 'limit' i 'offset' do paginacji wyników.",
+    tool="search_legal_acts",
+)
+_HINT_NO_RESULTS_AND_LOGIC = Hint(
+    message="Brak wyników. UWAGA: Słowa kluczowe API działają z logiką AND — "
+    "wszystkie muszą wystąpić jednocześnie. Spróbuj mniej słów kluczowych "
+    "lub szukaj każdego osobno (logika OR).",
+    tool="search_legal_acts",
+)
+_HINT_NO_RESULTS_BROADEN = Hint(
+    message="Spróbuj poszerzyć kryteria: usuń filtry dat, zmień typ dokumentu lub rok.",
+    tool="search_legal_acts",
+)
+_HINT_NO_RESULTS_METADATA = Hint(
+    message="Sprawdź dostępne słowa kluczowe, typy lub statusy w metadanych systemu.",
+    tool="get_system_metadata",
+    parameters={"category": "keywords"},
+)
+_NO_RESULTS_HINTS = (_HINT_NO_RESULTS_AND_LOGIC, _HINT_NO_RESULTS_BROADEN, _HINT_NO_RESULTS_METADATA)
+_HINT_JUST_LOADED = Hint(
+    message="Dokument załadowany do pamięci. TTL: 2h. Po tym czasie wymagane ponowne załadowanie (load_content=true).",
+)
+_HINT_METADATA_KEYWORDS = Hint(
+    message="Użyj pobranych słów kluczowych do wyszukiwania aktów prawnych.",
+    tool="search_legal_acts",
+)
+_HINT_METADATA_TYPES = Hint(
+    message="Filtruj wyniki wyszukiwania po typie dokumentu (np. 'Ustawa', 'Rozporządzenie').",
+    tool="search_legal_acts",
+)
+_HINT_TRACK_CHANGES = Hint(
+    message="Śledź zmiany prawne w czasie.",
+    tool="track_legal_changes",
+)
+_HINT_DATE_SEARCH = Hint(
+    message="Użyj obliczonej daty jako filtra w wyszukiwaniu aktów prawnych.",
+    tool="search_legal_acts",
+)
+_HINT_DATE_TRACK_CHANGES = Hint(
+    message="Śledź zmiany prawne w zakresie dat.",
+    tool="track_legal_changes",
+)
+
 
 def search_hints(
     total_count: int,
@@ -15,6 +60,10 @@ def search_hints(
     applied_limit: int | None = None,
 ) -> list[Hint]:
     """Generate hints for search results."""
+    if total_count == 0 and not has_results:
+        # Nothing matched, so only the fixed no-results hints apply
+        return list(_NO_RESULTS_HINTS)
+
     hints = []
     if has_results and eli:
         hints.append(
@@ -33,42 +82,18 @@ def search_hints(
             )
         )
     if was_truncated and applied_limit:
+        narrow_part = " lub filter_results do zawężenia" if result_set_id else ""
         hints.append(
             Hint(
                 message=f"Wyniki ograniczone do {applied_limit} (z {total_count} dostępnych). "
-                f"Użyj limit/offset do paginacji lub filter_results do zawężenia.",
+                f"Użyj limit/offset do paginacji{narrow_part}.",
                 tool="search_legal_acts",
             )
         )
     elif total_count > 20:
-        hints.append(
-            Hint(
-                message="Użyj parametrów 'limit' i 'offset' do paginacji wyników.",
-                tool="search_legal_acts",
-            )
-        )
+        hints.append(_HINT_PAGINATION)
     if not has_results:
-        hints.append(
-            Hint(
-                message="Brak wyników. UWAGA: Słowa kluczowe API działają z logiką AND — "
-                "wszystkie muszą wystąpić jednocześnie. Spróbuj mniej słów kluczowych "
-                "lub szukaj każdego osobno (logika OR).",
-                tool="search_legal_acts",
-            )
-        )
-        hints.append(
-            Hint(
-                message="Spróbuj poszerzyć kryteria: usuń filtry dat, zmień typ dokumentu lub rok.",
-                tool="search_legal_acts",
-            )
-        )
-        hints.append(
-            Hint(
-                message="Sprawdź dostępne słowa kluczowe, typy lub statusy w metadanych systemu.",
-                tool="get_system_metadata",
-                parameters={"category": "keywords"},
-            )
-        )
+        hints.extend(_NO_RESULTS_HINTS)
     return hints
 
 
@@ -91,12 +116,7 @@ def act_details_hints(
         )
     if is_loaded:
         if just_loaded:
-            hints.append(
-                Hint(
-                    message="Dokument załadowany do pamięci. TTL: 2h. "
-                    "Po tym czasie wymagane ponowne załadowanie (load_content=true).",
-                )
-            )
+            hints.append(_HINT_JUST_LOADED)
         hints.append(
             Hint(
                 message="Przeczytaj wybraną sekcję aktu.",
@@ -125,19 +145,9 @@ def metadata_hints(category: str) -> list[Hint]:
     """Generate hints for metadata results."""
     hints = []
     if category in ("all", "keywords"):
-        hints.append(
-            Hint(
-                message="Użyj pobranych słów kluczowych do wyszukiwania aktów prawnych.",
-                tool="search_legal_acts",
-            )
-        )
+        hints.append(_HINT_METADATA_KEYWORDS)
     if category in ("all", "types"):
-        hints.append(
-            Hint(
-                message="Filtruj wyniki wyszukiwania po typie dokumentu (np. 'Ustawa', 'Rozporządzenie').",
-                tool="search_legal_acts",
-            )
-        )
+        hints.append(_HINT_METADATA_TYPES)
     return hints
 
 
@@ -170,27 +180,13 @@ def relationships_hints(eli: str, relationship_types: list[str]) -> list[Hint]:
         ),
     ]
     if any(t in relationship_types for t in ("Akty zmieniające", "Akty zmienione")):
-        hints.append(
-            Hint(
-                message="Śledź zmiany prawne w czasie.",
-                tool="track_legal_changes",
-            )
-        )
+        hints.append(_HINT_TRACK_CHANGES)
     return hints
 
 
 def date_hints() -> list[Hint]:
     """Generate hints for date calculations."""
-    return [
-        Hint(
-            message="Użyj obliczonej daty jako filtra w wyszukiwaniu aktów prawnych.",
-            tool="search_legal_acts",
-        ),
-        Hint(
-            message="Śledź zmiany prawne w zakresie dat.",
-            tool="track_legal_changes",
-        ),
-    ]
+    return [_HINT_DATE_SEARCH, _HINT_DATE_TRACK_CHANGES]
 
 
 def compare_hints(eli_a: str, eli_b: str) -> list[Hint]:
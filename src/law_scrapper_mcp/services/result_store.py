@@ -4,9 +4,13 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import operator
 import re
 import time
+from collections.abc import Callable
 from dataclasses import dataclass, field
+from datetime import datetime
+from functools import lru_cache
 from typing import Any
 
 from law_scrapper_mcp.models.tool_outputs import ActSummaryOutput
@@ -24,6 +28,7 @@ class StoredResultSet:
     total_count: int
     created_at: float = field(default_factory=time.time)
     last_accessed: float = field(default_factory=time.time)
+    access_seq: int = 0
 
 
 @dataclass
@@ -38,13 +43,20 @@ class FilterHit:
 class ResultStore:
     """In-memory store for search/browse results with grep-like filtering."""
 
-    def __init__(self, max_sets: int = 20, ttl: int = 3600):
+    def __init__(self, max_sets: int = 20, ttl: int = 3600, min_results: int = 2):
         self._store: dict[str, StoredResultSet] = {}
         self._max_sets = max_sets
         self._ttl = ttl
+        # An empty set is never worth a slot, whatever the configured minimum
+        self._min_results = max(min_results, 1)
         self._counter = 0
+        self._seq = 0
         self._lock = asyncio.Lock()
 
+    def should_store(self, result_count: int) -> bool:
+        """Check whether a result set of this size is worth storing for filtering."""
+        return result_count >= self._min_results
+
     async def store(
         self,
         results: list[ActSummaryOutput],
@@ -53,7 +65,8 @@ class ResultStore:
     ) -> str:
         """Store a result set and return its ID."""
         async with self._lock:
-            self._evict_expired()
+            now = time.time()
+            self._evict_expired(now)
 
             if len(self._store) >= self._max_sets:
                 self._evict_lru()
@@ -61,12 +74,15 @@ class ResultStore:
             self._counter += 1
             result_set_id = f"rs_{self._counter}"
 
-            self._store[result_set_id] = StoredResultSet(
+            rs = StoredResultSet(
                 result_set_id=result_set_id,
                 results=results,
                 query_summary=query_summary,
                 total_count=total_count,
+                created_at=now,
             )
+            self._touch(rs, now)
+            self._store[result_set_id] = rs
             logger.info(f"Stored result set {result_set_id}: {len(results)} results (query: {query_summary})")
             return result_set_id
 
@@ -76,23 +92,24 @@ class ResultStore:
             rs = self._store.get(result_set_id)
             if rs is None:
                 return None
-            if time.time() - rs.last_accessed > self._ttl:
+            now = time.time()
+            if now - rs.last_accessed > self._ttl:
                 del self._store[result_set_id]
                 return None
-            rs.last_accessed = time.time()
+            self._touch(rs, now)
             return rs
 
     async def list_sets(self) -> list[dict[str, Any]]:
         """List all available result sets."""
         async with self._lock:
-            self._evict_expired()
+            self._evict_expired(time.time())
             return [
                 {
                     "result_set_id": rs.result_set_id,
                     "query_summary": rs.query_summary,
                     "result_count": len(rs.results),
                     "total_count": rs.total_count,
-                    "created_at": time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(rs.created_at)),
+                    "created_at": datetime.fromtimestamp(rs.created_at).isoformat(sep=" ", timespec="seconds"),
                 }
                 for rs in self._store.values()
             ]
@@ -118,31 +135,30 @@ class ResultStore:
         if rs is None:
             raise ResultSetNotFoundError(result_set_id)
 
-        filtered = list(rs.results)
-        original_count = len(filtered)
-
-        # Exact match filters
-        if type_equals is not None:
-            filtered = [r for r in filtered if r.type and r.type == type_equals]
-
-        if status_equals is not None:
-            filtered = [r for r in filtered if r.status == status_equals]
+        original_count = len(rs.results)
 
-        if year_equals is not None:
-            filtered = [r for r in filtered if r.year == year_equals]
-
-        # Regex pattern filter
+        compiled: Callable[[str], bool] | None = None
         if pattern is not None:
             try:
-                compiled = re.compile(pattern, re.IGNORECASE)
+                compiled = _compile_pattern(pattern)
             except re.error as e:
                 raise ValueError(f"Invalid regex pattern: {e}") from e
 
-            filtered = [r for r in filtered if _match_field(r, field, compiled)]
+        range_field = date_field if date_field in _DATE_FIELDS and (date_from or date_to) else None
+
+        def matches(r: ActSummaryOutput) -> bool:
+            # Cheap exact checks first so the regex and date checks run on fewer rows
+            if type_equals is not None and not (r.type and r.type == type_equals):
+                return False
+            if status_equals is not None and r.status != status_equals:
+                return False
+            if year_equals is not None and r.year != year_equals:
+                return False
+            if compiled is not None and not _match_field(r, field, compiled):
+                return False
+            return range_field is None or _date_in_range(getattr(r, range_field, None), date_from, date_to)
 
-        # Date range filter
-        if date_field and (date_from or date_to):
-            filtered = _filter_by_date(filtered, date_field, date_from, date_to)
+        filtered = [r for r in rs.results if matches(r)]
 
         # Sorting
         if sort_by:
@@ -154,9 +170,14 @@ class ResultStore:
 
         return filtered, original_count
 
-    def _evict_expired(self) -> None:
+    def _touch(self, rs: StoredResultSet, now: float) -> None:
+        """Record an access for TTL and LRU bookkeeping (called under lock)."""
+        self._seq += 1
+        rs.access_seq = self._seq
+        rs.last_accessed = now
+
+    def _evict_expired(self, now: float) -> None:
         """Remove expired result sets (called under lock)."""
-        now = time.time()
         expired = [k for k, v in self._store.items() if now - v.last_accessed > self._ttl]
         for key in expired:
             del self._store[key]
@@ -165,9 +186,9 @@ class ResultStore:
         """Remove least recently used result set (called under lock)."""
         if not self._store:
             return
-        lru_key = min(self._store, key=lambda k: self._store[k].last_accessed)
-        logger.info(f"Evicting LRU result set: {lru_key}")
-        del self._store[lru_key]
+        lru = min(self._store.values(), key=operator.attrgetter("access_seq"))
+        logger.info(f"Evicting LRU result set: {lru.result_set_id}")
+        del self._store[lru.result_set_id]
 
 
 class ResultSetNotFoundError(Exception):
@@ -187,10 +208,30 @@ class ResultSetNotFoundError(Exception):
 _SEARCHABLE_FIELDS = {"title", "eli", "status", "type", "publisher"}
 _DATE_FIELDS = {"promulgation_date", "effective_date"}
 _SORTABLE_FIELDS = {"title", "eli", "year", "pos", "status", "type", "promulgation_date", "effective_date"}
+_REGEX_METACHARS = frozenset(".^$*+?{}[]()\\")
+
+
+@lru_cache(maxsize=64)
+def _compile_pattern(pattern: str) -> Callable[[str], bool]:
+    """Build a case-insensitive matcher for a filter pattern (cached; chained filters reuse patterns).
+
+    Plain alternations of literals (e.g. 'podatek|VAT') skip the regex engine and use substring tests.
+    """
+    if _REGEX_METACHARS.isdisjoint(pattern):
+        needles = tuple(pattern.lower().split("|"))
+
+        def contains_any(value: str) -> bool:
+            value = value.lower()
+            return any(needle in value for needle in needles)
 
+        return contains_any
 
-def _match_field(act: ActSummaryOutput, field: str, compiled: re.Pattern[str]) -> bool:
-    """Check if a field value matches the compiled regex."""
+    search = re.compile(pattern, re.IGNORECASE).search
+    return lambda value: search(value) is not None
+
+
+def _match_field(act: ActSummaryOutput, field: str, compiled: Callable[[str], bool]) -> bool:
+    """Check if a field value matches the compiled pattern."""
     if field not in _SEARCHABLE_FIELDS:
         # Default to searching title
         field = "title"
@@ -198,30 +239,16 @@ def _match_field(act: ActSummaryOutput, field: str, compiled: re.Pattern[str]) -
     value = getattr(act, field, None)
     if value is None:
         return False
-    return compiled.search(str(value)) is not None
+    return compiled(str(value))
 
 
-def _filter_by_date(
-    results: list[ActSummaryOutput],
-    date_field: str,
-    date_from: str | None,
-    date_to: str | None,
-) -> list[ActSummaryOutput]:
-    """Filter results by date range."""
-    if date_field not in _DATE_FIELDS:
-        return results
-
-    filtered = []
-    for r in results:
-        value = getattr(r, date_field, None)
-        if value is None:
-            continue
-        if date_from and value < date_from:
-            continue
-        if date_to and value > date_to:
-            continue
-        filtered.append(r)
-    return filtered
+def _date_in_range(value: str | None, date_from: str | None, date_to: str | None) -> bool:
+    """Check if an ISO date string falls within the (inclusive) range."""
+    if value is None:
+        return False
+    if date_from and value < date_from:
+        return False
+    return not (date_to and value > date_to)
 
 
 def _sort_results(
@@ -233,10 +260,10 @@ def _sort_results(
     if sort_by not in _SORTABLE_FIELDS:
         return results
 
-    def key_fn(r: ActSummaryOutput) -> Any:
-        val = getattr(r, sort_by, None)
-        if val is None:
-            return "" if isinstance(getattr(ActSummaryOutput, sort_by, ""), str) else 0
-        return val
+    getter = operator.attrgetter(sort_by)
+    present = [r for r in results if getter(r) is not None]
+    missing = [r for r in results if getter(r) is None]
+    present.sort(key=getter, reverse=desc)
 
-    return sorted(results, key=key_fn, reverse=desc)
+    # Missing values sort as the smallest value
+    return present + missing if desc else missing + present
@@ -1,6 +1,7 @@
 """Search service for legal acts."""
 
 import logging
+from collections.abc import Callable
 from typing import Any
 
 from law_scrapper_mcp.client.sejm_client import SejmApiClient
@@ -71,9 +72,10 @@ class SearchService:
         data = await self._client.get_json("acts/search", params=params, cache_ttl=settings.cache_search_ttl)
 
         items = data.get("items", [])
-        total_count = data.get("count", len(items))
+        # "count" is the size of the returned page; prefer the full match count when the API reports it
+        total_count = data.get("totalCount", data.get("count", len(items)))
 
-        results = [self._format_act(item, detail_level) for item in items]
+        results = list(map(_formatter_for(detail_level), items))
 
         return results, total_count, " | ".join(summary_parts)
 
@@ -87,25 +89,41 @@ class SearchService:
         items = data.get("items", [])
         total_count = data.get("totalCount", len(items))
 
-        results = [self._format_act(item, detail_level) for item in items]
+        results = list(map(_formatter_for(detail_level), items))
 
         return results, total_count
 
-    def _format_act(self, item: dict[str, Any], detail_level: DetailLevel) -> ActSummaryOutput:
-        """Format an act item based on detail level."""
-        output = ActSummaryOutput(
-            eli=item.get("ELI", ""),
-            publisher=item.get("publisher", ""),
-            year=item.get("year", 0),
-            pos=item.get("pos", 0),
-            title=item.get("title", ""),
-            status=item.get("status", ""),
-        )
-
-        if detail_level in (DetailLevel.STANDARD, DetailLevel.FULL):
-            output.type = item.get("type")
-            output.promulgation_date = item.get("promulgation")
-            output.effective_date = item.get("dateEffect")
-            output.in_force = item.get("inForce")
-
-        return output
+
+def _format_minimal(item: dict[str, Any]) -> ActSummaryOutput:
+    """Format an act item with the minimal field set."""
+    get = item.get
+    return ActSummaryOutput(
+        eli=get("ELI", ""),
+        publisher=get("publisher", ""),
+        year=get("year", 0),
+        pos=get("pos", 0),
+        title=get("title", ""),
+        status=get("status", ""),
+    )
+
+
+def _format_detailed(item: dict[str, Any]) -> ActSummaryOutput:
+    """Format an act item with type, dates and in-force status (standard/full)."""
+    get = item.get
+    return ActSummaryOutput(
+        eli=get("ELI", ""),
+        publisher=get("publisher", ""),
+        year=get("year", 0),
+        pos=get("pos", 0),
+        title=get("title", ""),
+        status=get("status", ""),
+        type=get("type"),
+        promulgation_date=get("promulgation"),
+        effective_date=get("dateEffect"),
+        in_force=get("inForce"),
+    )
+
+
+def _formatter_for(detail_level: DetailLevel) -> Callable[[dict[str, Any]], ActSummaryOutput]:
+    """Pick the act formatter once per request instead of branching per item."""
+    return _format_minimal if detail_level is DetailLevel.MINIMAL else _format_detailed
@@ -8,6 +8,7 @@ from fastmcp import Context, FastMCP
 from law_scrapper_mcp.models.tool_outputs import (
     ContentOutput,
     EnrichedResponse,
+    Hint,
     LoadedDocumentInfo,
     LoadedDocumentListOutput,
 )
@@ -70,17 +71,17 @@ def register(mcp: FastMCP) -> None:
 
         if section is None:
             # Return table of contents
-            sections = await document_store.get_toc(eli)
-            toc = [{"id": s.id, "title": s.title, "level": s.level} for s in sections]
+            toc = await document_store.get_toc_entries(eli)
+            toc_count = len(toc)
             response = EnrichedResponse(
                 data=ContentOutput(
                     eli=eli,
                     section_id=None,
                     section_title="Spis treści",
-                    content=f"Znaleziono {len(toc)} sekcji",
+                    content=f"Znaleziono {toc_count} sekcji",
                     toc=toc,
                 ),
-                hints=content_hints(eli, len(toc) > 0),
+                hints=content_hints(eli, toc_count > 0),
             )
         else:
             # Read specific section
@@ -133,12 +134,11 @@ def register(mcp: FastMCP) -> None:
         document_store = ctx.lifespan_context["document_store"]
 
         raw_docs = await document_store.list_documents()
-        documents = [LoadedDocumentInfo(**d) for d in raw_docs]
+        # Store output is already well-typed; skip per-item validation
+        documents = [LoadedDocumentInfo.model_construct(**d) for d in raw_docs]
 
         hints = []
         if documents:
-            from law_scrapper_mcp.models.tool_outputs import Hint
-
             hints.append(
                 Hint(
                     message=f"Użyj read_act_content(eli='{documents[0].eli}') aby czytać treść.",
@@ -7,6 +7,7 @@ from fastmcp import Context, FastMCP
 
 from law_scrapper_mcp.models.tool_outputs import ActDetailOutput, EnrichedResponse
 from law_scrapper_mcp.services.response_enrichment import act_details_hints
+from law_scrapper_mcp.tools.coercion import to_bool
 from law_scrapper_mcp.tools.error_handling import handle_tool_errors
 
 logger = logging.getLogger(__name__)
@@ -68,11 +69,7 @@ def register(mcp: FastMCP) -> None:
         assert ctx is not None
         act_service = ctx.lifespan_context["act_service"]
 
-        # Normalize bool (MCP clients may send string)
-        if isinstance(load_content, str):
-            load_content_bool = load_content.lower() in ("true", "1", "yes")
-        else:
-            load_content_bool = bool(load_content)
+        load_content_bool = to_bool(load_content)
 
         act_details = await act_service.get_details(eli=eli, load_content=load_content_bool)
 
@@ -1,16 +1,18 @@
 """Search within loaded legal acts."""
 
-import contextlib
 import logging
 from typing import Annotated
 
 from fastmcp import Context, FastMCP
 
-from law_scrapper_mcp.models.tool_outputs import EnrichedResponse, SearchInActOutput
+from law_scrapper_mcp.models.tool_outputs import EnrichedResponse, Hint, SearchInActOutput
+from law_scrapper_mcp.tools.coercion import to_int
 from law_scrapper_mcp.tools.error_handling import handle_tool_errors
 
 logger = logging.getLogger(__name__)
 
+MAX_SEARCH_HITS = 200
+
 
 def register(mcp: FastMCP) -> None:
     """Register search in act tool."""
@@ -49,7 +51,8 @@ def register(mcp: FastMCP) -> None:
         WYMAGANIE: Akt musi być wcześniej załadowany za pomocą
         get_act_details(eli=..., load_content=True).
 
-        Zwraca wszystkie trafienia z kontekstem i informacją o sekcji.
+        Zwraca trafienia (maksymalnie 200) z kontekstem i informacją o sekcji.
+        Gdy limit zostanie osiągnięty, pole truncated ma wartość true.
 
         Przykłady:
         - search_in_act(eli="DU/2024/1692", query="straż") - Znajdź "straż" w akcie
@@ -61,12 +64,13 @@ def register(mcp: FastMCP) -> None:
         assert ctx is not None
         document_store = ctx.lifespan_context["document_store"]
 
-        # Normalize int (MCP clients may send string)
-        context_chars_int = 500
-        with contextlib.suppress(ValueError, TypeError):
-            context_chars_int = int(context_chars)
+        context_chars_int = to_int(context_chars, 500)
 
-        hits = await document_store.search(eli, query, context_chars_int)
+        # Ask for one extra hit so a capped result can be told apart from an exact fit
+        hits = await document_store.search(eli, query, context_chars_int, max_hits=MAX_SEARCH_HITS + 1)
+        truncated = len(hits) > MAX_SEARCH_HITS
+        if truncated:
+            hits = hits[:MAX_SEARCH_HITS]
 
         matches = [
             {
@@ -78,13 +82,26 @@ def register(mcp: FastMCP) -> None:
             for hit in hits
         ]
 
+        hints = []
+        if truncated:
+            hints.append(
+                Hint(
+                    message=f"Zwrócono tylko pierwsze {MAX_SEARCH_HITS} trafień. "
+                    "Zawęź zapytanie (np. dłuższa fraza) lub przeczytaj wybraną sekcję przez read_act_content.",
+                    tool="search_in_act",
+                    parameters={"eli": eli},
+                )
+            )
+
         response = EnrichedResponse(
             data=SearchInActOutput(
                 eli=eli,
                 query=query,
                 matches=matches,
                 total_matches=len(matches),
+                truncated=truncated,
             ),
+            hints=hints,
         )
 
         return response.model_dump_json()
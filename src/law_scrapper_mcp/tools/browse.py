@@ -1,14 +1,13 @@
 """Browse legal acts by publisher and year."""
 
-import contextlib
 import logging
 from typing import Annotated
 
 from fastmcp import Context, FastMCP
 
-from law_scrapper_mcp.models.enums import DetailLevel
 from law_scrapper_mcp.models.tool_outputs import EnrichedResponse, SearchOutput
 from law_scrapper_mcp.services.response_enrichment import search_hints
+from law_scrapper_mcp.tools.coercion import to_detail_level, to_int
 from law_scrapper_mcp.tools.error_handling import handle_tool_errors
 
 logger = logging.getLogger(__name__)
@@ -62,24 +61,14 @@ def register(mcp: FastMCP) -> None:
         - browse_acts(publisher="DU", year=2000) - Akty z roku 2000
         """
         assert ctx is not None
-        search_service = ctx.lifespan_context["search_service"]
-        result_store = ctx.lifespan_context["result_store"]
+        lifespan = ctx.lifespan_context
+        search_service = lifespan["search_service"]
+        result_store = lifespan["result_store"]
 
-        # Normalize year (MCP clients may send string)
-        year_int = 0
-        with contextlib.suppress(ValueError, TypeError):
-            year_int = int(year)
+        year_int = to_int(year, 0)
+        limit_int = to_int(limit)
 
-        limit_int: int | None = None
-        if limit is not None:
-            with contextlib.suppress(ValueError, TypeError):
-                limit_int = int(limit)
-
-        # Convert detail_level string to enum
-        try:
-            detail_enum = DetailLevel(detail_level)
-        except ValueError:
-            detail_enum = DetailLevel.STANDARD
+        detail_enum = to_detail_level(detail_level)
 
         results, total_count = await search_service.browse(
             publisher=publisher,
@@ -92,11 +81,12 @@ def register(mcp: FastMCP) -> None:
         was_truncated = len(results) > effective_limit
         if was_truncated:
             results = results[:effective_limit]
+        returned_count = len(results)
 
-        # Store results for subsequent filtering
+        # Store results for subsequent filtering (a single hit leaves nothing to narrow down)
         query_summary = f"publisher={publisher} | year={year}"
         result_set_id = None
-        if results:
+        if result_store.should_store(returned_count):
             result_set_id = await result_store.store(results, query_summary, total_count)
 
         first_eli = results[0].eli if results else None
@@ -106,12 +96,12 @@ def register(mcp: FastMCP) -> None:
                 results=results,
                 total_count=total_count,
                 query_summary=query_summary,
-                returned_count=len(results),
+                returned_count=returned_count,
                 result_set_id=result_set_id,
             ),
             hints=search_hints(
                 total_count,
-                len(results) > 0,
+                returned_count > 0,
                 first_eli,
                 result_set_id,
                 was_truncated=was_truncated,
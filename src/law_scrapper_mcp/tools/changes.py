@@ -58,8 +58,10 @@ def register(mcp: FastMCP) -> None:
         - track_legal_changes(date_from="2024-01-01", keywords=["zdrowotny"]) - Zmiany zdrowotne
         """
         assert ctx is not None
-        changes_service = ctx.lifespan_context["changes_service"]
-        result_store = ctx.lifespan_context["result_store"]
+        lifespan = ctx.lifespan_context
+        changes_service = lifespan["changes_service"]
+        result_store = lifespan["result_store"]
+        keywords = keywords or []
 
         results, date_range = await changes_service.track_changes(
             publisher=publisher,
@@ -68,21 +70,21 @@ def register(mcp: FastMCP) -> None:
             keywords=keywords,
         )
 
-        # Store results for subsequent filtering
+        # Store results for subsequent filtering (a single hit leaves nothing to narrow down)
+        result_count = len(results)
         result_set_id = None
-        if results:
-            query_summary = f"changes: {date_range} | publisher={publisher}"
-            if keywords:
-                query_summary += f" | keywords={','.join(keywords)}"
-            result_set_id = await result_store.store(results, query_summary, len(results))
+        if result_store.should_store(result_count):
+            keywords_part = f" | keywords={','.join(keywords)}" if keywords else ""
+            query_summary = f"changes: {date_range} | publisher={publisher}{keywords_part}"
+            result_set_id = await result_store.store(results, query_summary, result_count)
 
         response = EnrichedResponse(
             data=ChangesOutput(
                 date_range=date_range,
                 publisher=publisher,
-                keywords=keywords or [],
+                keywords=keywords,
                 changes=results,
-                total_count=len(results),
+                total_count=result_count,
                 result_set_id=result_set_id,
             ),
         )
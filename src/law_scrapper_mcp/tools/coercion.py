@@ -0,0 +1,33 @@
+"""Coercion helpers for tool parameters (MCP clients may send int/bool as strings)."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from law_scrapper_mcp.models.enums import DetailLevel
+
+TRUTHY_STRINGS = frozenset({"true", "1", "yes", "on", "t", "y", "tak"})
+
+_DETAIL_LEVELS = {level.value: level for level in DetailLevel}
+
+
+def to_int(value: Any, default: int | None = None) -> int | None:
+    """Convert value to int, returning default if it is missing or not a number."""
+    try:
+        return int(value)
+    except (ValueError, TypeError):
+        return default
+
+
+def to_bool(value: Any) -> bool:
+    """Convert value to bool, accepting common truthy strings (including Polish 'tak')."""
+    if value is True or value is False:
+        return value
+    if isinstance(value, str):
+        return value.strip().lower() in TRUTHY_STRINGS
+    return bool(value)
+
+
+def to_detail_level(value: Any) -> DetailLevel:
+    """Convert value to DetailLevel, falling back to STANDARD for unknown values."""
+    return _DETAIL_LEVELS.get(value, DetailLevel.STANDARD)
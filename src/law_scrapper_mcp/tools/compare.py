@@ -1,17 +1,52 @@
 """Compare metadata of two legal acts."""
 
+import asyncio
 import logging
+from collections.abc import Iterator
 from typing import Annotated, Any
 
 from fastmcp import Context, FastMCP
 
-from law_scrapper_mcp.models.tool_outputs import CompareOutput, EnrichedResponse
+from law_scrapper_mcp.models.tool_outputs import ActDetailOutput, CompareOutput, EnrichedResponse
 from law_scrapper_mcp.services.response_enrichment import compare_hints
 from law_scrapper_mcp.tools.error_handling import handle_tool_errors
 
 logger = logging.getLogger(__name__)
 
 
+def _iter_differences(
+    details_a: ActDetailOutput, details_b: ActDetailOutput, only_a: set[str], only_b: set[str]
+) -> Iterator[str]:
+    """Yield human-readable metadata differences between two acts."""
+    if details_a.title != details_b.title:
+        yield "Tytuły różnią się"
+
+    if (details_a.type or "N/A") != (details_b.type or "N/A"):
+        yield f"Typy różnią się: '{details_a.type or 'N/A'}' vs '{details_b.type or 'N/A'}'"
+
+    if details_a.status != details_b.status:
+        yield f"Statusy różnią się: '{details_a.status}' vs '{details_b.status}'"
+
+    if details_a.promulgation_date != details_b.promulgation_date:
+        yield (
+            f"Daty promulgacji różnią się: "
+            f"'{details_a.promulgation_date or 'N/A'}' vs "
+            f"'{details_b.promulgation_date or 'N/A'}'"
+        )
+
+    if details_a.entry_into_force != details_b.entry_into_force:
+        yield (
+            f"Daty wejścia w życie różnią się: "
+            f"'{details_a.entry_into_force or 'N/A'}' vs "
+            f"'{details_b.entry_into_force or 'N/A'}'"
+        )
+
+    if only_a:
+        yield f"Słowa kluczowe tylko w A: {', '.join(sorted(only_a))}"
+    if only_b:
+        yield f"Słowa kluczowe tylko w B: {', '.join(sorted(only_b))}"
+
+
 def register(mcp: FastMCP) -> None:
     """Register compare acts tool."""
 
@@ -59,9 +94,14 @@ def register(mcp: FastMCP) -> None:
         assert ctx is not None
         act_service = ctx.lifespan_context["act_service"]
 
-        # Fetch details for both acts (no content loading needed)
-        details_a = await act_service.get_details(eli=eli_a, load_content=False)
-        details_b = await act_service.get_details(eli=eli_b, load_content=False)
+        # Fetch details for both acts (no content loading needed); same ELI is fetched once
+        if eli_a == eli_b:
+            details_a = details_b = await act_service.get_details(eli=eli_a, load_content=False)
+        else:
+            details_a, details_b = await asyncio.gather(
+                act_service.get_details(eli=eli_a, load_content=False),
+                act_service.get_details(eli=eli_b, load_content=False),
+            )
 
         # Build comparison dict
         comparison: dict[str, Any] = {
@@ -81,47 +121,21 @@ def register(mcp: FastMCP) -> None:
             "keywords_b": details_b.keywords,
         }
 
-        # Calculate common keywords
-        set_a = set(details_a.keywords)
-        set_b = set(details_b.keywords)
-        common_keywords = sorted(set_a.intersection(set_b))
-
-        # Identify differences
-        differences: list[str] = []
-
-        if details_a.title != details_b.title:
-            differences.append("Tytuły różnią się")
-
-        if (details_a.type or "N/A") != (details_b.type or "N/A"):
-            differences.append(f"Typy różnią się: '{details_a.type or 'N/A'}' vs '{details_b.type or 'N/A'}'")
-
-        if details_a.status != details_b.status:
-            differences.append(f"Statusy różnią się: '{details_a.status}' vs '{details_b.status}'")
-
-        if details_a.promulgation_date != details_b.promulgation_date:
-            differences.append(
-                f"Daty promulgacji różnią się: "
-                f"'{details_a.promulgation_date or 'N/A'}' vs "
-                f"'{details_b.promulgation_date or 'N/A'}'"
-            )
-
-        if details_a.entry_into_force != details_b.entry_into_force:
-            differences.append(
-                f"Daty wejścia w życie różnią się: "
-                f"'{details_a.entry_into_force or 'N/A'}' vs "
-                f"'{details_b.entry_into_force or 'N/A'}'"
-            )
-
-        if set_a != set_b:
+        # Calculate common and differing keywords (identical lists skip the set algebra)
+        only_a: set[str] = set()
+        only_b: set[str] = set()
+        if details_a.keywords == details_b.keywords:
+            common_keywords = sorted(set(details_a.keywords))
+        else:
+            set_a = set(details_a.keywords)
+            set_b = set(details_b.keywords)
+            common_keywords = sorted(set_a & set_b)
             only_a = set_a - set_b
             only_b = set_b - set_a
-            if only_a:
-                differences.append(f"Słowa kluczowe tylko w A: {', '.join(sorted(only_a))}")
-            if only_b:
-                differences.append(f"Słowa kluczowe tylko w B: {', '.join(sorted(only_b))}")
 
-        if not differences:
-            differences.append("Brak istotnych różnic w metadanych")
+        differences = list(_iter_differences(details_a, details_b, only_a, only_b)) or [
+            "Brak istotnych różnic w metadanych"
+        ]
 
         output = CompareOutput(
             eli_a=eli_a,
@@ -2,10 +2,11 @@
 
 import contextlib
 import logging
-import re
-from datetime import datetime
+from datetime import date, timedelta
+from functools import lru_cache
 from typing import Annotated
 
+from dateutil.relativedelta import relativedelta  # type: ignore[import-untyped]
 from fastmcp import Context, FastMCP
 
 from law_scrapper_mcp.models.tool_outputs import DateOutput, EnrichedResponse
@@ -15,21 +16,16 @@ from law_scrapper_mcp.tools.error_handling import handle_tool_errors
 logger = logging.getLogger(__name__)
 
 
-def _parse_flexible_date(date_str: str) -> datetime:
+@lru_cache(maxsize=256)
+def _parse_flexible_date(date_str: str) -> date:
     """Parse date in various formats: YYYY, YYYY-MM, YYYY-MM-DD."""
     date_str = date_str.strip()
 
-    # YYYY-MM-DD
-    if re.match(r"^\d{4}-\d{2}-\d{2}$", date_str):
-        return datetime.strptime(date_str, "%Y-%m-%d")
-
-    # YYYY-MM
-    if re.match(r"^\d{4}-\d{2}$", date_str):
-        return datetime.strptime(date_str + "-01", "%Y-%m-%d")
-
-    # YYYY
-    if re.match(r"^\d{4}$", date_str):
-        return datetime.strptime(date_str + "-01-01", "%Y-%m-%d")
+    # Fixed-position scan: YYYY at [0:4], optional -MM at [4:7], optional -DD at [7:10]
+    if len(date_str) in (4, 7, 10) and date_str.isascii():
+        year, month, day = date_str[0:4], date_str[5:7] or "01", date_str[8:10] or "01"
+        if (year + month + day).isdecimal() and date_str[4:5] in ("", "-") and date_str[7:8] in ("", "-"):
+            return date(int(year), int(month), int(day))
 
     raise ValueError(
         f"Nieprawidłowy format daty: '{date_str}'. "
@@ -39,6 +35,16 @@ def _parse_flexible_date(date_str: str) -> datetime:
     )
 
 
+def _polish_plural(n: int, one: str, few: str, many: str) -> str:
+    """Format abs(n) with a Polish noun form: 1 → one, 2-4 → few, otherwise many."""
+    a = abs(n)
+    if a == 1:
+        return f"1 {one}"
+    if 2 <= a <= 4:
+        return f"{a} {few}"
+    return f"{a} {many}"
+
+
 def register(mcp: FastMCP) -> None:
     """Register date calculation tool."""
 
@@ -89,8 +95,6 @@ def register(mcp: FastMCP) -> None:
         - calculate_legal_date(months=6, days=15) - 6 miesięcy i 15 dni od dziś
         - calculate_legal_date(years=-5, base_date="2024") - 5 lat przed 1 stycznia 2024
         """
-        from dateutil.relativedelta import relativedelta  # type: ignore[import-untyped]
-
         assert ctx is not None
 
         # Normalize int params (MCP clients may send strings)
@@ -105,41 +109,24 @@ def register(mcp: FastMCP) -> None:
             years_int = int(years)
 
         # Parse base date or use today
-        if base_date:
-            base = _parse_flexible_date(base_date)
-            base_date_str = base.strftime("%Y-%m-%d")
-        else:
-            base = datetime.now()
-            base_date_str = base.strftime("%Y-%m-%d")
+        base = _parse_flexible_date(base_date) if base_date else date.today()
+        base_date_str = base.isoformat()
 
         # Calculate new date
-        result_date = base + relativedelta(days=days_int, months=months_int, years=years_int)
-        result_str = result_date.strftime("%Y-%m-%d")
+        if months_int == 0 and years_int == 0:
+            result_date = base + timedelta(days=days_int)
+        else:
+            result_date = base + relativedelta(days=days_int, months=months_int, years=years_int)
+        result_str = result_date.isoformat()
 
         # Build description
         parts = []
         if years_int != 0:
-            y = abs(years_int)
-            if y == 1:
-                parts.append("1 rok")
-            elif 2 <= y <= 4:
-                parts.append(f"{y} lata")
-            else:
-                parts.append(f"{y} lat")
+            parts.append(_polish_plural(years_int, "rok", "lata", "lat"))
         if months_int != 0:
-            m = abs(months_int)
-            if m == 1:
-                parts.append("1 miesiąc")
-            elif 2 <= m <= 4:
-                parts.append(f"{m} miesiące")
-            else:
-                parts.append(f"{m} miesięcy")
+            parts.append(_polish_plural(months_int, "miesiąc", "miesiące", "miesięcy"))
         if days_int != 0:
-            d = abs(days_int)
-            if d == 1:
-                parts.append("1 dzień")
-            else:
-                parts.append(f"{d} dni")
+            parts.append(_polish_plural(days_int, "dzień", "dni", "dni"))
 
         if not parts:
             description = f"Data bazowa: {base_date_str}"
@@ -31,12 +31,21 @@ _ERROR_CATEGORIES: dict[type[Exception], str] = {
 }
 
 
+# Resolved category per concrete exception type (filled lazily by _classify_error)
+_CATEGORY_CACHE: dict[type[Exception], str] = {}
+
+
 def _classify_error(exc: Exception) -> str:
     """Classify exception into error category."""
-    for exc_type, category in _ERROR_CATEGORIES.items():
-        if isinstance(exc, exc_type):
-            return category
-    return "internal"
+    exc_cls = type(exc)
+    category = _CATEGORY_CACHE.get(exc_cls)
+    if category is None:
+        category = next(
+            (cat for exc_type, cat in _ERROR_CATEGORIES.items() if issubclass(exc_cls, exc_type)),
+            "internal",
+        )
+        _CATEGORY_CACHE[exc_cls] = category
+    return category
 
 
 def handle_tool_errors(
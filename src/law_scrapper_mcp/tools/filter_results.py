@@ -1,6 +1,5 @@
 """Filter and narrow down previously retrieved search/browse results."""
 
-import contextlib
 import logging
 from typing import Annotated
 
@@ -9,9 +8,12 @@ from fastmcp import Context, FastMCP
 from law_scrapper_mcp.models.tool_outputs import (
     EnrichedResponse,
     FilterOutput,
+    Hint,
     ResultSetInfo,
     ResultSetListOutput,
 )
+from law_scrapper_mcp.services.result_store import ResultSetNotFoundError
+from law_scrapper_mcp.tools.coercion import to_bool, to_int
 from law_scrapper_mcp.tools.error_handling import handle_tool_errors
 
 logger = logging.getLogger(__name__)
@@ -109,36 +111,41 @@ def register(mcp: FastMCP) -> None:
         result_store = ctx.lifespan_context["result_store"]
 
         # Normalize params (MCP clients may send int/bool as strings)
-        year_int: int | None = None
-        if year_equals is not None:
-            with contextlib.suppress(ValueError, TypeError):
-                year_int = int(year_equals)
+        year_int = to_int(year_equals)
+        limit_int = to_int(limit)
+        sort_desc_bool = to_bool(sort_desc)
 
-        limit_int: int | None = None
-        if limit is not None:
-            with contextlib.suppress(ValueError, TypeError):
-                limit_int = int(limit)
-
-        sort_desc_bool = sort_desc.lower() in ("true", "1", "yes") if isinstance(sort_desc, str) else bool(sort_desc)
-
-        filtered, original_count = await result_store.filter_results(
-            result_set_id,
-            pattern=pattern,
-            field=field,
-            type_equals=type_equals,
-            status_equals=status_equals,
-            year_equals=year_int,
-            date_field=date_field,
-            date_from=date_from,
-            date_to=date_to,
-            sort_by=sort_by,
-            sort_desc=sort_desc_bool,
-            limit=limit_int,
+        has_filter = any(
+            v is not None for v in (pattern, type_equals, status_equals, year_int, date_field, sort_by, limit_int)
         )
 
+        if has_filter:
+            filtered, original_count = await result_store.filter_results(
+                result_set_id,
+                pattern=pattern,
+                field=field,
+                type_equals=type_equals,
+                status_equals=status_equals,
+                year_equals=year_int,
+                date_field=date_field,
+                date_from=date_from,
+                date_to=date_to,
+                sort_by=sort_by,
+                sort_desc=sort_desc_bool,
+                limit=limit_int,
+            )
+        else:
+            # Nothing to narrow: return the stored set as-is
+            rs = await result_store.get(result_set_id)
+            if rs is None:
+                raise ResultSetNotFoundError(result_set_id)
+            filtered, original_count = rs.results, len(rs.results)
+
         # Store filtered results as a new set for potential chaining
         new_set_id = None
-        if filtered:
+        if filtered and not has_filter:
+            new_set_id = result_set_id
+        elif filtered:
             filters_desc = _build_filters_description(
                 pattern=pattern,
                 field=field,
@@ -155,32 +162,24 @@ def register(mcp: FastMCP) -> None:
                 total_count=len(filtered),
             )
 
-        filters_applied = {}
-        if pattern:
-            filters_applied["pattern"] = pattern
-            filters_applied["field"] = field
-        if type_equals:
-            filters_applied["type_equals"] = type_equals
-        if status_equals:
-            filters_applied["status_equals"] = status_equals
-        if year_int:
-            filters_applied["year_equals"] = year_int
-        if date_field:
-            filters_applied["date_field"] = date_field
-            if date_from:
-                filters_applied["date_from"] = date_from
-            if date_to:
-                filters_applied["date_to"] = date_to
-        if sort_by:
-            filters_applied["sort_by"] = sort_by
-            filters_applied["sort_desc"] = sort_desc_bool
-        if limit_int:
-            filters_applied["limit"] = limit_int
+        candidates = {
+            "pattern": pattern,
+            "field": field if pattern else None,
+            "type_equals": type_equals,
+            "status_equals": status_equals,
+            "year_equals": year_int,
+            "date_field": date_field,
+            "date_from": date_from if date_field else None,
+            "date_to": date_to if date_field else None,
+            "sort_by": sort_by,
+            "sort_desc": sort_desc_bool if sort_by else None,
+            "limit": limit_int,
+        }
+        # Drop unset/empty entries, but keep an explicit ascending sort (sort_desc=False)
+        filters_applied = {k: v for k, v in candidates.items() if v or v is False}
 
         hints = []
         if filtered:
-            from law_scrapper_mcp.models.tool_outputs import Hint
-
             hints.append(
                 Hint(
                     message="Użyj get_act_details aby zobaczyć szczegóły wybranego aktu.",
@@ -239,8 +238,6 @@ def register(mcp: FastMCP) -> None:
 
         hints = []
         if sets:
-            from law_scrapper_mcp.models.tool_outputs import Hint
-
             hints.append(
                 Hint(
                     message=f"Użyj filter_results(result_set_id='{sets[0].result_set_id}') aby filtrować wyniki.",
@@ -12,6 +12,8 @@ from law_scrapper_mcp.tools.error_handling import handle_tool_errors
 
 logger = logging.getLogger(__name__)
 
+_CATEGORIES = {category.value: category for category in MetadataCategory}
+
 
 def register(mcp: FastMCP) -> None:
     """Register metadata tool."""
@@ -52,10 +54,7 @@ def register(mcp: FastMCP) -> None:
         metadata_service = ctx.lifespan_context["metadata_service"]
 
         # Convert string to enum
-        try:
-            category_enum = MetadataCategory(category)
-        except ValueError:
-            category_enum = MetadataCategory.ALL
+        category_enum = _CATEGORIES.get(category, MetadataCategory.ALL)
 
         metadata = await metadata_service.get_metadata(category_enum)
 
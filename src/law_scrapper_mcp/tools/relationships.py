@@ -57,11 +57,11 @@ def register(mcp: FastMCP) -> None:
         assert ctx is not None
         client = ctx.lifespan_context["client"]
 
-        # Parse ELI
-        parts = eli.split("/")
-        if len(parts) != 3:
+        # Parse ELI (exactly two separators)
+        publisher, _, rest = eli.partition("/")
+        year, sep, pos = rest.partition("/")
+        if not sep or "/" in pos:
             raise ValueError(f"Nieprawidłowy format ELI: {eli}. Oczekiwany: wydawca/rok/pozycja")
-        publisher, year, pos = parts
 
         # Get references
         references_data = await client.get_json(f"acts/{publisher}/{year}/{pos}/references")
@@ -69,13 +69,17 @@ def register(mcp: FastMCP) -> None:
         # Process relationships
         relationships = {}
         if isinstance(references_data, dict):
-            for key, value in references_data.items():
-                if relationship_type is None or key == relationship_type:
+            if relationship_type is None:
+                for key, value in references_data.items():
                     relationships[key] = value if isinstance(value, list) else [value]
+            elif relationship_type in references_data:
+                value = references_data[relationship_type]
+                relationships[relationship_type] = value if isinstance(value, list) else [value]
         elif isinstance(references_data, list):
             relationships["references"] = references_data
 
-        total_count = sum(len(v) if isinstance(v, list) else 1 for v in relationships.values())
+        # Every value is a list at this point
+        total_count = sum(map(len, relationships.values()))
 
         response = EnrichedResponse(
             data=RelationshipsOutput(
@@ -1,14 +1,13 @@
 """Search legal acts tool."""
 
-import contextlib
 import logging
 from typing import Annotated
 
 from fastmcp import Context, FastMCP
 
-from law_scrapper_mcp.models.enums import DetailLevel
 from law_scrapper_mcp.models.tool_outputs import EnrichedResponse, SearchOutput
 from law_scrapper_mcp.services.response_enrichment import search_hints
+from law_scrapper_mcp.tools.coercion import to_bool, to_detail_level, to_int
 from law_scrapper_mcp.tools.error_handling import handle_tool_errors
 
 logger = logging.getLogger(__name__)
@@ -104,34 +103,21 @@ def register(mcp: FastMCP) -> None:
         - search_legal_acts(title="budżet", year=2024) - Akty budżetowe z 2024
         """
         assert ctx is not None
-        search_service = ctx.lifespan_context["search_service"]
-        result_store = ctx.lifespan_context["result_store"]
+        lifespan = ctx.lifespan_context
+        search_service = lifespan["search_service"]
+        result_store = lifespan["result_store"]
 
         # Normalize params (MCP clients may send int/bool as strings)
-        year_int: int | None = None
-        if year is not None:
-            with contextlib.suppress(ValueError, TypeError):
-                year_int = int(year)
-
-        limit_int: int | None = None
-        if limit is not None:
-            with contextlib.suppress(ValueError, TypeError):
-                limit_int = int(limit)
-
-        offset_int: int | None = None
-        if offset is not None:
-            with contextlib.suppress(ValueError, TypeError):
-                offset_int = int(offset)
-
-        in_force_bool: bool | None = None
-        if in_force is not None:
-            in_force_bool = in_force.lower() in ("true", "1", "yes") if isinstance(in_force, str) else bool(in_force)
-
-        # Convert detail_level string to enum
-        try:
-            detail_enum = DetailLevel(detail_level)
-        except ValueError:
-            detail_enum = DetailLevel.STANDARD
+        year_int = to_int(year)
+        limit_int = to_int(limit)
+        offset_int = to_int(offset)
+        in_force_bool = None if in_force is None else to_bool(in_force)
+
+        detail_enum = to_detail_level(detail_level)
+
+        # Apply default limit if no explicit limit was provided; ask the API for one
+        # extra row so truncation can be detected without fetching the whole page
+        effective_limit = limit_int if limit_int is not None else DEFAULT_SEARCH_LIMIT
 
         results, total_count, query_summary = await search_service.search(
             publisher=publisher,
@@ -144,20 +130,18 @@ def register(mcp: FastMCP) -> None:
             pub_date_from=pub_date_from,
             pub_date_to=pub_date_to,
             in_force=in_force_bool,
-            limit=limit_int,
+            limit=effective_limit + 1,
             offset=offset_int,
             detail_level=detail_enum,
         )
 
-        # Apply default limit if no explicit limit was provided
-        effective_limit = limit_int if limit_int is not None else DEFAULT_SEARCH_LIMIT
         was_truncated = len(results) > effective_limit
         if was_truncated:
             results = results[:effective_limit]
 
-        # Store results for subsequent filtering
+        # Store results for subsequent filtering (a single hit leaves nothing to narrow down)
         result_set_id = None
-        if results:
+        if result_store.should_store(len(results)):
             result_set_id = await result_store.store(results, query_summary, total_count)
 
         first_eli = results[0].eli if results else None
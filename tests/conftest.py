@@ -1,4 +1,7 @@
-"""Pytest configuration and shared fixtures for Law Scrapper MCP tests."""
+"""Pytest configuration and shared fixtures for Law Scrapper MCP tests.
+
+File-backed fixtures are session-scoped and loaded once; tests must not mutate them.
+"""
 
 from __future__ import annotations
 
@@ -16,46 +19,52 @@ from law_scrapper_mcp.services.content_processor import ContentProcessor
 from law_scrapper_mcp.services.document_store import DocumentStore
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def fixtures_dir() -> Path:
     """Return the fixtures directory path."""
     return Path(__file__).parent / "fixtures"
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_act_html(fixtures_dir: Path) -> str:
     """Load sample HTML act content."""
     return (fixtures_dir / "sample_act.html").read_text(encoding="utf-8")
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
+def sample_act_markdown(content_processor: ContentProcessor, sample_act_html: str) -> str:
+    """Sample act HTML converted to Markdown once per session."""
+    return content_processor.html_to_markdown(sample_act_html)
+
+
+@pytest.fixture(scope="session")
 def search_results(fixtures_dir: Path) -> dict:
     """Load search results fixture."""
-    return json.loads((fixtures_dir / "search_results.json").read_text(encoding="utf-8"))
+    return json.loads((fixtures_dir / "search_results.json").read_bytes())
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def act_detail(fixtures_dir: Path) -> dict:
     """Load act detail fixture."""
-    return json.loads((fixtures_dir / "act_detail.json").read_text(encoding="utf-8"))
+    return json.loads((fixtures_dir / "act_detail.json").read_bytes())
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def act_structure(fixtures_dir: Path) -> list:
     """Load act structure fixture."""
-    return json.loads((fixtures_dir / "act_structure.json").read_text(encoding="utf-8"))
+    return json.loads((fixtures_dir / "act_structure.json").read_bytes())
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def act_references(fixtures_dir: Path) -> dict:
     """Load act references fixture."""
-    return json.loads((fixtures_dir / "act_references.json").read_text(encoding="utf-8"))
+    return json.loads((fixtures_dir / "act_references.json").read_bytes())
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def publishers_data(fixtures_dir: Path) -> list:
     """Load publishers fixture."""
-    return json.loads((fixtures_dir / "publishers.json").read_text(encoding="utf-8"))
+    return json.loads((fixtures_dir / "publishers.json").read_bytes())
 
 
 @pytest.fixture
@@ -82,9 +91,9 @@ def document_store() -> DocumentStore:
     return DocumentStore(max_documents=10, max_size_bytes=5 * 1024 * 1024, ttl=7200)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def content_processor() -> ContentProcessor:
-    """Create a ContentProcessor instance."""
+    """Create a ContentProcessor instance (stateless, shared across the session)."""
     return ContentProcessor()
 
 
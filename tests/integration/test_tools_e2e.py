@@ -30,6 +30,8 @@ import json
 from typing import Any
 
 import pytest
+import respx
+from httpx import Response
 
 pytestmark = pytest.mark.integration
 
@@ -171,6 +173,16 @@ class TestSearchTools:
         assert payload["data"]["returned_count"] == 3
         assert payload["data"]["result_set_id"] is not None
 
+    async def test_search_legal_acts_single_result_not_stored(self, mcp_client) -> None:
+        """A one-row search is not stored as a result set and gets no filter_results hint."""
+        result = await mcp_client.call_tool("search_legal_acts", {"year": 2024, "limit": 1})
+        payload = _parse_tool_result(result)
+
+        _assert_enriched(payload)
+        assert payload["data"]["returned_count"] == 1
+        assert payload["data"]["result_set_id"] is None
+        assert all(h["tool"] != "filter_results" for h in payload["hints"])
+
     async def test_search_legal_acts_returns_enriched_results(self, mcp_client) -> None:
         """Each result in search output carries required fields."""
         result = await mcp_client.call_tool("search_legal_acts", {"year": 2024})
@@ -273,6 +285,19 @@ class TestFilterTools:
             assert filter_payload["data"]["result_set_id"] is not None
             assert filter_payload["data"]["result_set_id"] != rs_id
 
+    async def test_filter_results_without_filters_reuses_set(self, mcp_client) -> None:
+        """filter_results with no filters returns the source set without storing a copy."""
+        search = await mcp_client.call_tool("search_legal_acts", {"year": 2024})
+        search_payload = _parse_tool_result(search)
+        rs_id = search_payload["data"]["result_set_id"]
+
+        result = await mcp_client.call_tool("filter_results", {"result_set_id": rs_id})
+        payload = _parse_tool_result(result)
+
+        _assert_enriched(payload)
+        assert payload["data"]["result_set_id"] == rs_id
+        assert payload["data"]["filtered_count"] == payload["data"]["original_count"]
+
 
 # ---------------------------------------------------------------------------
 # get_act_details, list_loaded_documents
@@ -403,6 +428,21 @@ class TestActContentTools:
         assert payload["data"]["total_matches"] == 0
         assert payload["data"]["matches"] == []
 
+    async def test_search_in_act_reports_truncation(self, mcp_client) -> None:
+        """search_in_act flags capped results and hints at narrowing the query."""
+        respx.get("https://api.sejm.gov.pl/eli/acts/DU/2024/1/text.html").mock(
+            return_value=Response(200, text=f"<html><body><h1>Test Act</h1><p>{'kara ' * 250}</p></body></html>")
+        )
+        await self._load_act(mcp_client)
+
+        result = await mcp_client.call_tool("search_in_act", {"eli": "DU/2024/1", "query": "kara", "context_chars": 5})
+        payload = _parse_tool_result(result)
+
+        _assert_enriched(payload)
+        assert payload["data"]["total_matches"] == 200
+        assert payload["data"]["truncated"] is True
+        assert any(h["tool"] == "search_in_act" for h in payload["hints"])
+
 
 # ---------------------------------------------------------------------------
 # analyze_act_relationships, compare_acts
@@ -3,7 +3,6 @@
 from __future__ import annotations
 
 import asyncio
-import time
 from unittest.mock import patch
 
 from law_scrapper_mcp.client.cache import TTLCache
@@ -63,23 +62,29 @@ class TestTTLExpiration:
 
     async def test_expired_entry_returns_none(self, cache: TTLCache):
         """Test that expired entries return None."""
-        await cache.set("key1", "value1", ttl=1)
-        time.sleep(1.1)
-        assert await cache.get("key1") is None
+        with patch("time.time") as mock_time:
+            mock_time.return_value = 1000.0
+            await cache.set("key1", "value1", ttl=1)
+            mock_time.return_value = 1001.1
+            assert await cache.get("key1") is None
 
     async def test_expired_entry_removed_from_cache(self, cache: TTLCache):
         """Test that expired entries are removed from internal storage."""
-        await cache.set("key1", "value1", ttl=1)
-        initial_size = cache.size
-        time.sleep(1.1)
-        await cache.get("key1")  # This should trigger cleanup
-        assert cache.size < initial_size
+        with patch("time.time") as mock_time:
+            mock_time.return_value = 1000.0
+            await cache.set("key1", "value1", ttl=1)
+            initial_size = cache.size
+            mock_time.return_value = 1001.1
+            await cache.get("key1")  # This should trigger cleanup
+            assert cache.size < initial_size
 
     async def test_not_yet_expired_entry(self, cache: TTLCache):
         """Test that entries within TTL are still accessible."""
-        await cache.set("key1", "value1", ttl=5)
-        time.sleep(1)
-        assert await cache.get("key1") == "value1"
+        with patch("time.time") as mock_time:
+            mock_time.return_value = 1000.0
+            await cache.set("key1", "value1", ttl=5)
+            mock_time.return_value = 1001.0
+            assert await cache.get("key1") == "value1"
 
     async def test_ttl_with_mock_time(self, cache: TTLCache):
         """Test TTL expiration using mocked time."""
@@ -140,6 +145,22 @@ class TestLRUEviction:
             assert await small_cache.get("key1") is None
             assert await small_cache.get("key2") is not None
 
+    async def test_overwrite_refreshes_eviction_order(self):
+        """Test that overwriting a key makes it the newest entry."""
+        small_cache = TTLCache(max_entries=3)
+
+        with patch("time.time") as mock_time:
+            for i, key in enumerate(("key1", "key2", "key3", "key1")):
+                mock_time.return_value = 1000.0 + i
+                await small_cache.set(key, key, ttl=3600)
+
+            mock_time.return_value = 1010.0
+            await small_cache.set("key4", "value4", ttl=3600)
+
+            # key2 is now the oldest entry, not the rewritten key1
+            assert await small_cache.get("key2") is None
+            assert await small_cache.get("key1") == "key1"
+
     async def test_eviction_clears_expired_first(self):
         """Test that expired entries are cleared before LRU eviction."""
         small_cache = TTLCache(max_entries=3)
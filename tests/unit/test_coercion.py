@@ -0,0 +1,49 @@
+"""Tests for tool parameter coercion helpers."""
+
+from __future__ import annotations
+
+import pytest
+
+from law_scrapper_mcp.models.enums import DetailLevel
+from law_scrapper_mcp.tools.coercion import to_bool, to_detail_level, to_int
+
+
+class TestToInt:
+    """Tests for to_int."""
+
+    @pytest.mark.parametrize(("value", "expected"), [(5, 5), ("42", 42), (" 7 ", 7)])
+    def test_valid(self, value, expected):
+        """Test ints and numeric strings are converted."""
+        assert to_int(value) == expected
+
+    @pytest.mark.parametrize("value", [None, "abc", "", "1.5"])
+    def test_invalid_returns_default(self, value):
+        """Test unparsable values fall back to the default."""
+        assert to_int(value) is None
+        assert to_int(value, 500) == 500
+
+
+class TestToBool:
+    """Tests for to_bool."""
+
+    @pytest.mark.parametrize("value", [True, 1, "true", "TRUE", "1", "yes", "on", "t", "y", "Tak", " true "])
+    def test_truthy(self, value):
+        """Test truthy values."""
+        assert to_bool(value) is True
+
+    @pytest.mark.parametrize("value", [False, 0, None, "false", "0", "no", ""])
+    def test_falsy(self, value):
+        """Test falsy values."""
+        assert to_bool(value) is False
+
+
+class TestToDetailLevel:
+    """Tests for to_detail_level."""
+
+    @pytest.mark.parametrize(
+        ("value", "expected"),
+        [("minimal", DetailLevel.MINIMAL), ("full", DetailLevel.FULL), ("bogus", DetailLevel.STANDARD)],
+    )
+    def test_values(self, value, expected):
+        """Test known levels map to the enum and unknown ones fall back to standard."""
+        assert to_detail_level(value) is expected
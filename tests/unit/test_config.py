@@ -10,98 +10,56 @@ from law_scrapper_mcp.config import Settings
 class TestSettingsDefaults:
     """Tests for default configuration values."""
 
-    def test_transport_default(self):
-        """Test default transport setting."""
-        settings = Settings()
-        assert settings.transport == "stdio"
-
-    def test_host_and_port_defaults(self):
-        """Test default host and port."""
-        settings = Settings()
-        assert settings.host == "0.0.0.0"
-        assert settings.port == 7683
-
-    def test_api_timeout_default(self):
-        """Test default API timeout."""
-        settings = Settings()
-        assert settings.api_timeout == 30.0
-
-    def test_api_concurrency_defaults(self):
-        """Test default API concurrency settings."""
-        settings = Settings()
-        assert settings.api_max_concurrent == 10
-        assert settings.api_max_retries == 3
-
-    def test_cache_ttl_defaults(self):
-        """Test default cache TTL values."""
-        settings = Settings()
-        assert settings.cache_metadata_ttl == 86400  # 24 hours
-        assert settings.cache_search_ttl == 600  # 10 minutes
-        assert settings.cache_browse_ttl == 3600  # 1 hour
-        assert settings.cache_details_ttl == 3600  # 1 hour
-        assert settings.cache_changes_ttl == 300  # 5 minutes
-        assert settings.cache_max_entries == 1000
-
-    def test_document_store_defaults(self):
-        """Test default document store settings."""
-        settings = Settings()
-        assert settings.doc_store_max_documents == 10
-        assert settings.doc_store_max_size_bytes == 5 * 1024 * 1024  # 5 MB
-        assert settings.doc_store_ttl == 7200  # 2 hours
-
-    def test_logging_defaults(self):
-        """Test default logging settings."""
-        settings = Settings()
-        assert settings.log_level == "INFO"
-        assert settings.log_format == "text"
-
-    def test_server_info_defaults(self):
-        """Test default server info."""
-        settings = Settings()
-        assert settings.server_name == "law-scrapper-mcp"
-        assert settings.server_version == "2.4.0"
+    @pytest.mark.parametrize(
+        ("attr", "expected"),
+        [
+            ("transport", "stdio"),
+            ("host", "0.0.0.0"),
+            ("port", 7683),
+            ("api_timeout", 30.0),
+            ("api_max_concurrent", 10),
+            ("api_max_retries", 3),
+            ("cache_metadata_ttl", 86400),  # 24 hours
+            ("cache_search_ttl", 600),  # 10 minutes
+            ("cache_browse_ttl", 3600),  # 1 hour
+            ("cache_details_ttl", 3600),  # 1 hour
+            ("cache_changes_ttl", 300),  # 5 minutes
+            ("cache_max_entries", 1000),
+            ("doc_store_max_documents", 10),
+            ("doc_store_max_size_bytes", 5 * 1024 * 1024),  # 5 MB
+            ("doc_store_ttl", 7200),  # 2 hours
+            ("result_store_min_results", 2),
+            ("log_level", "INFO"),
+            ("log_format", "text"),
+            ("server_name", "law-scrapper-mcp"),
+            ("server_version", "2.4.0"),
+        ],
+    )
+    def test_default(self, attr, expected):
+        """Test each setting's declared default (read from the schema, so ambient env vars don't interfere)."""
+        assert Settings.model_fields[attr].default == expected
 
 
 class TestSettingsFromEnvironment:
     """Tests for loading settings from environment variables."""
 
-    def test_transport_from_env(self, monkeypatch):
-        """Test loading transport from environment variable."""
-        monkeypatch.setenv("LAW_MCP_TRANSPORT", "sse")
-        settings = Settings()
-        assert settings.transport == "sse"
-
-    def test_port_from_env(self, monkeypatch):
-        """Test loading port from environment variable."""
-        monkeypatch.setenv("LAW_MCP_PORT", "9000")
-        settings = Settings()
-        assert settings.port == 9000
-
-    def test_api_timeout_from_env(self, monkeypatch):
-        """Test loading API timeout from environment variable."""
-        monkeypatch.setenv("LAW_MCP_API_TIMEOUT", "60.0")
-        settings = Settings()
-        assert settings.api_timeout == 60.0
-
-    def test_cache_ttl_from_env(self, monkeypatch):
-        """Test loading cache TTL from environment variable."""
-        monkeypatch.setenv("LAW_MCP_CACHE_SEARCH_TTL", "1200")
-        settings = Settings()
-        assert settings.cache_search_ttl == 1200
-
-    def test_doc_store_from_env(self, monkeypatch):
-        """Test loading document store settings from environment."""
-        monkeypatch.setenv("LAW_MCP_DOC_STORE_MAX_DOCUMENTS", "20")
-        monkeypatch.setenv("LAW_MCP_DOC_STORE_TTL", "3600")
-        settings = Settings()
-        assert settings.doc_store_max_documents == 20
-        assert settings.doc_store_ttl == 3600
-
-    def test_log_level_from_env(self, monkeypatch):
-        """Test loading log level from environment variable."""
-        monkeypatch.setenv("LAW_MCP_LOG_LEVEL", "DEBUG")
-        settings = Settings()
-        assert settings.log_level == "DEBUG"
+    @pytest.mark.parametrize(
+        ("env", "value", "attr", "expected"),
+        [
+            ("LAW_MCP_TRANSPORT", "sse", "transport", "sse"),
+            ("LAW_MCP_PORT", "9000", "port", 9000),
+            ("LAW_MCP_API_TIMEOUT", "60.0", "api_timeout", 60.0),
+            ("LAW_MCP_CACHE_SEARCH_TTL", "1200", "cache_search_ttl", 1200),
+            ("LAW_MCP_DOC_STORE_MAX_DOCUMENTS", "20", "doc_store_max_documents", 20),
+            ("LAW_MCP_DOC_STORE_TTL", "3600", "doc_store_ttl", 3600),
+            ("LAW_MCP_LOG_LEVEL", "DEBUG", "log_level", "DEBUG"),
+        ],
+    )
+    def test_single_env_var(self, monkeypatch, env, value, attr, expected):
+        """Test loading one setting from its environment variable."""
+        monkeypatch.setenv(env, value)
+        settings = Settings()
+        assert getattr(settings, attr) == expected
 
     def test_multiple_env_vars(self, monkeypatch):
         """Test loading multiple settings from environment variables."""
@@ -118,6 +76,9 @@ class TestSettingsFromEnvironment:
 
     def test_env_prefix_required(self, monkeypatch):
         """Test that env vars without LAW_MCP_ prefix are ignored."""
+        # Ambient prefixed vars (e.g. from CI) would mask what this test checks
+        monkeypatch.delenv("LAW_MCP_TRANSPORT", raising=False)
+        monkeypatch.delenv("LAW_MCP_PORT", raising=False)
         monkeypatch.setenv("TRANSPORT", "sse")  # Wrong prefix
         monkeypatch.setenv("PORT", "9000")  # Wrong prefix
 
@@ -130,20 +91,9 @@ class TestSettingsFromEnvironment:
 class TestSettingsValidation:
     """Tests for settings validation."""
 
-    def test_invalid_port_type(self, monkeypatch):
-        """Test that invalid port type raises error."""
-        monkeypatch.setenv("LAW_MCP_PORT", "invalid")
-        with pytest.raises((ValueError, TypeError)):
-            Settings()
-
-    def test_invalid_timeout_type(self, monkeypatch):
-        """Test that invalid timeout type raises error."""
-        monkeypatch.setenv("LAW_MCP_API_TIMEOUT", "invalid")
-        with pytest.raises((ValueError, TypeError)):
-            Settings()
-
-    def test_invalid_ttl_type(self, monkeypatch):
-        """Test that invalid TTL type raises error."""
-        monkeypatch.setenv("LAW_MCP_CACHE_SEARCH_TTL", "invalid")
+    @pytest.mark.parametrize("env", ["LAW_MCP_PORT", "LAW_MCP_API_TIMEOUT", "LAW_MCP_CACHE_SEARCH_TTL"])
+    def test_invalid_numeric_value(self, monkeypatch, env):
+        """Test that a non-numeric value for a numeric setting raises error."""
+        monkeypatch.setenv(env, "invalid")
         with pytest.raises((ValueError, TypeError)):
             Settings()
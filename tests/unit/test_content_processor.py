@@ -4,9 +4,24 @@ from __future__ import annotations
 
 from unittest.mock import MagicMock, patch
 
+import pytest
+
 from law_scrapper_mcp.services.content_processor import ContentProcessor, Section
 
 
+def _make_pdf_mock(page_texts: list[str | None]) -> MagicMock:
+    """Build a pdfplumber.open() result whose pages return the given texts."""
+    pdf = MagicMock()
+    pdf.__enter__.return_value.pages = [MagicMock(**{"extract_text.return_value": t}) for t in page_texts]
+    return pdf
+
+
+@pytest.fixture(scope="module")
+def sample_sections(content_processor: ContentProcessor, sample_act_markdown: str) -> list[Section]:
+    """Sections indexed from the sample act once per module; treat as read-only."""
+    return content_processor.index_sections(sample_act_markdown)
+
+
 class TestHtmlToMarkdown:
     """Tests for HTML to Markdown conversion."""
 
@@ -17,9 +32,9 @@ class TestHtmlToMarkdown:
         assert "# Title" in md
         assert "Paragraph text." in md
 
-    def test_html_to_markdown_with_sample(self, content_processor: ContentProcessor, sample_act_html: str):
+    def test_html_to_markdown_with_sample(self, sample_act_markdown: str):
         """Test HTML to Markdown with sample act HTML."""
-        md = content_processor.html_to_markdown(sample_act_html)
+        md = sample_act_markdown
         assert "USTAWA z dnia 1 stycznia 2024 r." in md
         assert "Rozdział 1" in md
         assert "Art. 1." in md
@@ -66,17 +81,7 @@ class TestPdfToText:
     @patch("pdfplumber.open")
     def test_pdf_to_text_with_mock(self, mock_pdfplumber, content_processor: ContentProcessor):
         """Test PDF to text extraction with mocked pdfplumber."""
-        # Create mock PDF with pages
-        mock_page1 = MagicMock()
-        mock_page1.extract_text.return_value = "Page 1 text"
-
-        mock_page2 = MagicMock()
-        mock_page2.extract_text.return_value = "Page 2 text"
-
-        mock_pdf = MagicMock()
-        mock_pdf.__enter__.return_value.pages = [mock_page1, mock_page2]
-
-        mock_pdfplumber.return_value = mock_pdf
+        mock_pdfplumber.return_value = _make_pdf_mock(["Page 1 text", "Page 2 text"])
 
         text = content_processor.pdf_to_text(b"fake pdf bytes")
 
@@ -97,13 +102,7 @@ class TestPdfToText:
     @patch("pdfplumber.open")
     def test_pdf_to_text_no_text_on_page(self, mock_pdfplumber, content_processor: ContentProcessor):
         """Test PDF with pages that have no text."""
-        mock_page = MagicMock()
-        mock_page.extract_text.return_value = None
-
-        mock_pdf = MagicMock()
-        mock_pdf.__enter__.return_value.pages = [mock_page]
-
-        mock_pdfplumber.return_value = mock_pdf
+        mock_pdfplumber.return_value = _make_pdf_mock([None])
 
         text = content_processor.pdf_to_text(b"fake pdf")
         assert text == ""
@@ -158,10 +157,9 @@ More content here."""
         rozdzial_sections = [s for s in sections if "Rozdział" in s.title]
         assert len(rozdzial_sections) >= 2
 
-    def test_index_sections_with_sample_act(self, content_processor: ContentProcessor, sample_act_html: str):
+    def test_index_sections_with_sample_act(self, sample_sections: list[Section]):
         """Test indexing sections with sample act HTML."""
-        markdown = content_processor.html_to_markdown(sample_act_html)
-        sections = content_processor.index_sections(markdown)
+        sections = sample_sections
 
         assert len(sections) > 0
 
@@ -177,16 +175,10 @@ More content here."""
             assert section.start_pos >= 0
             assert section.end_pos is None or section.end_pos > section.start_pos
 
-    def test_index_sections_empty_markdown(self, content_processor: ContentProcessor):
-        """Test indexing with empty markdown."""
-        sections = content_processor.index_sections("")
-        assert sections == []
-
-    def test_index_sections_no_headings(self, content_processor: ContentProcessor):
-        """Test indexing markdown with no headings."""
-        markdown = "Just plain text without any headings."
-        sections = content_processor.index_sections(markdown)
-        assert sections == []
+    @pytest.mark.parametrize("markdown", ["", "Just plain text without any headings."])
+    def test_index_sections_trivial(self, content_processor: ContentProcessor, markdown: str):
+        """Test indexing empty markdown or markdown with no headings."""
+        assert content_processor.index_sections(markdown) == []
 
     def test_section_content_extraction(self, content_processor: ContentProcessor):
         """Test that section content is properly extracted."""
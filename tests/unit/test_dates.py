@@ -0,0 +1,50 @@
+"""Tests for date helpers used by calculate_legal_date."""
+
+from __future__ import annotations
+
+from datetime import date
+
+import pytest
+
+from law_scrapper_mcp.tools.dates import _parse_flexible_date, _polish_plural
+
+
+class TestParseFlexibleDate:
+    """Tests for _parse_flexible_date."""
+
+    @pytest.mark.parametrize(
+        ("value", "expected"),
+        [
+            ("2024-01-15", date(2024, 1, 15)),
+            ("2024-06", date(2024, 6, 1)),
+            ("2024", date(2024, 1, 1)),
+            ("  2024-02-29 ", date(2024, 2, 29)),
+        ],
+    )
+    def test_valid_formats(self, value, expected):
+        """Test YYYY-MM-DD, YYYY-MM and YYYY formats."""
+        assert _parse_flexible_date(value) == expected
+
+    @pytest.mark.parametrize("value", ["", "24", "2024/01/15", "2024-1-5", "15-01-2024", "2024-01-15T00:00"])
+    def test_invalid_format(self, value):
+        """Test unsupported formats raise a Polish error message."""
+        with pytest.raises(ValueError, match="Nieprawidłowy format daty"):
+            _parse_flexible_date(value)
+
+    @pytest.mark.parametrize("value", ["2024-13-01", "2023-02-29", "2024-00"])
+    def test_invalid_calendar_date(self, value):
+        """Test well-formed but impossible dates are rejected."""
+        with pytest.raises(ValueError):
+            _parse_flexible_date(value)
+
+
+class TestPolishPlural:
+    """Tests for _polish_plural."""
+
+    @pytest.mark.parametrize(
+        ("n", "expected"),
+        [(1, "1 rok"), (-1, "1 rok"), (3, "3 lata"), (-4, "4 lata"), (5, "5 lat"), (12, "12 lat")],
+    )
+    def test_forms(self, n, expected):
+        """Test singular, 2-4 and other counts pick the matching form."""
+        assert _polish_plural(n, "rok", "lata", "lat") == expected
@@ -40,6 +40,18 @@ class TestDocumentStoreBasicOperations:
         assert toc[0].id == "art_1"
         assert toc[1].id == "art_2"
 
+    async def test_get_toc_entries(self, document_store: DocumentStore):
+        """Test TOC entries are returned as copies of the cached rows."""
+        sections = [Section(id="art_1", title="Art. 1.", level=2, start_pos=0, end_pos=50)]
+        await document_store.load("DU/2024/1", "Test content", sections)
+
+        entries = await document_store.get_toc_entries("DU/2024/1")
+        assert entries == [{"id": "art_1", "title": "Art. 1.", "level": 2}]
+
+        entries[0]["title"] = "Changed"
+        entries.clear()
+        assert await document_store.get_toc_entries("DU/2024/1") == [{"id": "art_1", "title": "Art. 1.", "level": 2}]
+
     async def test_evict_document(self, document_store: DocumentStore):
         """Test manually evicting a document."""
         sections = [Section(id="art_1", title="Art. 1.", level=2, start_pos=0)]
@@ -109,6 +121,16 @@ class TestGetSection:
         content = await document_store.get_section("DU/2024/1", "art. 1")
         assert content is not None
 
+    async def test_get_section_prefers_document_order(self, document_store: DocumentStore):
+        """Test an earlier title-prefix match wins over a later exact id match."""
+        sections = [
+            Section(id="rozdzial_1", title="Przepisy ogólne", level=1, start_pos=0, content="First"),
+            Section(id="przepisy", title="Rozdział 2", level=1, start_pos=20, content="Second"),
+        ]
+        await document_store.load("DU/2024/1", "Test content", sections)
+
+        assert await document_store.get_section("DU/2024/1", "przepisy") == "First"
+
     async def test_get_section_art_pattern_matching(self, document_store: DocumentStore):
         """Test getting section using Art. X pattern."""
         sections = [
@@ -126,6 +148,17 @@ class TestGetSection:
         assert content is not None
         assert "article 123" in content
 
+    async def test_get_section_art_number_exact(self, document_store: DocumentStore):
+        """Test that Art. X lookup does not match an article with a longer number."""
+        sections = [
+            Section(id="a12", title="Art. 12. Earlier article", level=2, start_pos=0, content="Article 12"),
+            Section(id="a1", title="Art. 1. Later article", level=2, start_pos=20, content="Article 1"),
+        ]
+        await document_store.load("DU/2024/1", "Article 12 Article 1", sections)
+
+        content = await document_store.get_section("DU/2024/1", "Art 1")
+        assert content == "Article 1"
+
     async def test_get_section_not_found(self, document_store: DocumentStore):
         """Test getting non-existent section."""
         sections = [
@@ -176,6 +209,15 @@ class TestSearchInDocument:
         assert len(hits) == 1
         assert "KEYWORD" in hits[0].context
 
+    async def test_search_case_insensitive_polish(self, document_store: DocumentStore):
+        """Test case-insensitive search with Polish diacritics."""
+        markdown = "Art. 1. ZAŻÓŁĆ gęślą jaźń. Zażółć ponownie."
+        sections = [Section(id="art_1", title="Art. 1.", level=2, start_pos=0, content=markdown)]
+        await document_store.load("DU/2024/1", markdown, sections)
+
+        hits = await document_store.search("DU/2024/1", "zażółć")
+        assert [(h.match_start, h.match_end) for h in hits] == [(8, 14), (27, 33)]
+
     async def test_search_multiple_matches(self, document_store: DocumentStore):
         """Test search with multiple matches."""
         markdown = "Art. 1. Test keyword.\n\nArt. 2. Another keyword mention."
@@ -188,6 +230,16 @@ class TestSearchInDocument:
         hits = await document_store.search("DU/2024/1", "keyword")
         assert len(hits) == 2
 
+    async def test_search_max_hits(self, document_store: DocumentStore):
+        """Test that search stops after max_hits matches."""
+        markdown = "keyword " * 10
+        sections = [Section(id="art_1", title="Art. 1.", level=2, start_pos=0)]
+        await document_store.load("DU/2024/1", markdown, sections)
+
+        hits = await document_store.search("DU/2024/1", "keyword", max_hits=3)
+        assert len(hits) == 3
+        assert hits[-1].match_start == 16
+
     async def test_search_with_context(self, document_store: DocumentStore):
         """Test search context extraction."""
         markdown = "This is a long text with the keyword in the middle and more text after."
@@ -396,6 +448,20 @@ class TestLoadedDocument:
         expected_size = len(content.encode("utf-8"))
         assert doc.size_bytes == expected_size
 
+    def test_section_at(self):
+        """Test resolving markdown offsets to sections, including gaps."""
+        sections = [
+            Section(id="art_2", title="Art. 2.", level=2, start_pos=30, end_pos=50),
+            Section(id="art_1", title="Art. 1.", level=2, start_pos=5, end_pos=20),
+        ]
+        doc = LoadedDocument(eli="DU/2024/1", markdown="x" * 60, sections=sections)
+
+        assert doc.section_at(0) is None
+        assert doc.section_at(5).id == "art_1"
+        assert doc.section_at(25) is None
+        assert doc.section_at(49).id == "art_2"
+        assert doc.section_at(55) is None
+
     def test_loaded_document_timestamps(self):
         """Test that timestamps are set on creation."""
         import time
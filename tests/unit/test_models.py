@@ -166,6 +166,12 @@ class TestToolOutputModels:
         assert hint.tool is None
         assert hint.parameters is None
 
+    def test_hint_is_frozen(self):
+        """Test that Hint instances are immutable (shared as module constants)."""
+        hint = Hint(message="Simple hint")
+        with pytest.raises(ValidationError):
+            hint.message = "Changed"
+
     def test_enriched_response_creation(self):
         """Test EnrichedResponse model creation."""
         data = {"test": "value"}
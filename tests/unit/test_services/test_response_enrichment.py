@@ -0,0 +1,25 @@
+"""Tests for response enrichment hints."""
+
+from __future__ import annotations
+
+from law_scrapper_mcp.services.response_enrichment import search_hints
+
+
+class TestSearchHints:
+    """Tests for search_hints."""
+
+    def test_empty_search_returns_no_results_hints(self):
+        """Test an empty search gets only the fixed no-results hints, in a fresh list."""
+        hints = search_hints(0, False, applied_limit=20)
+
+        assert [h.tool for h in hints] == ["search_legal_acts", "search_legal_acts", "get_system_metadata"]
+        assert search_hints(0, False) == hints
+        assert search_hints(0, False) is not hints
+
+    def test_truncation_hint_mentions_filter_only_with_result_set(self):
+        """Test the truncation hint points to filter_results only when a result set was stored."""
+        stored = search_hints(5, True, "DU/2024/1", "rs_1", was_truncated=True, applied_limit=2)
+        unstored = search_hints(5, True, "DU/2024/1", None, was_truncated=True, applied_limit=1)
+
+        assert "filter_results" in stored[-1].message
+        assert "filter_results" not in unstored[-1].message
@@ -82,6 +82,10 @@ class TestResultStore:
     async def test_get_nonexistent_returns_none(self, store: ResultStore) -> None:
         assert await store.get("rs_999") is None
 
+    @pytest.mark.parametrize(("min_results", "count", "expected"), [(2, 1, False), (2, 2, True), (0, 0, False)])
+    def test_should_store(self, min_results: int, count: int, expected: bool) -> None:
+        assert ResultStore(min_results=min_results).should_store(count) is expected
+
     async def test_list_sets(self, store: ResultStore, sample_results: list[ActSummaryOutput]) -> None:
         await store.store(sample_results[:2], "query1", 2)
         await store.store(sample_results[2:], "query2", 3)
@@ -99,6 +103,17 @@ class TestResultStore:
         assert await store.get("rs_1") is None  # evicted
         assert await store.get("rs_6") is not None
 
+    async def test_evicts_least_recently_accessed(
+        self, store: ResultStore, sample_results: list[ActSummaryOutput]
+    ) -> None:
+        for i in range(5):
+            await store.store([sample_results[0]], f"query{i}", 1)
+        # Touch rs_1 so rs_2 becomes the least recently used
+        assert await store.get("rs_1") is not None
+        await store.store([sample_results[1]], "query5", 1)
+        assert await store.get("rs_2") is None
+        assert await store.get("rs_1") is not None
+
     async def test_evicts_expired(self) -> None:
         store = ResultStore(max_sets=5, ttl=0)  # TTL=0 → immediate expiry
         act = _make_act()
@@ -139,6 +154,13 @@ class TestResultStoreFiltering:
         filtered, _ = await store.filter_results(rs_id, pattern="podatk|transport")
         assert len(filtered) == 2
 
+    async def test_filter_literal_pattern_ignores_case(
+        self, store: ResultStore, sample_results: list[ActSummaryOutput]
+    ) -> None:
+        rs_id = await store.store(sample_results, "test", 5)
+        filtered, _ = await store.filter_results(rs_id, pattern="MINISTRA ZDROWIA|Transportu")
+        assert [r.eli for r in filtered] == ["DU/2024/2", "DU/2024/4", "DU/2024/5"]
+
     async def test_filter_by_regex_field_eli(self, store: ResultStore, sample_results: list[ActSummaryOutput]) -> None:
         rs_id = await store.store(sample_results, "test", 5)
         filtered, _ = await store.filter_results(rs_id, pattern="DU/2024/[12]$", field="eli")
@@ -170,6 +192,18 @@ class TestResultStoreFiltering:
         dates = [r.promulgation_date for r in filtered]
         assert dates == sorted(dates, key=lambda d: d or "", reverse=True)
 
+    async def test_filter_sort_missing_values_sort_lowest(self, store: ResultStore) -> None:
+        results = [
+            _make_act("DU/2024/1", promulgation_date="2024-05-01"),
+            _make_act("DU/2024/2", promulgation_date=None),
+            _make_act("DU/2024/3", promulgation_date="2024-01-01"),
+        ]
+        rs_id = await store.store(results, "test", 3)
+        ascending, _ = await store.filter_results(rs_id, sort_by="promulgation_date")
+        descending, _ = await store.filter_results(rs_id, sort_by="promulgation_date", sort_desc=True)
+        assert [r.eli for r in ascending] == ["DU/2024/2", "DU/2024/3", "DU/2024/1"]
+        assert [r.eli for r in descending] == ["DU/2024/1", "DU/2024/3", "DU/2024/2"]
+
     async def test_filter_limit(self, store: ResultStore, sample_results: list[ActSummaryOutput]) -> None:
         rs_id = await store.store(sample_results, "test", 5)
         filtered, _ = await store.filter_results(rs_id, limit=2)
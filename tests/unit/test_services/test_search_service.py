@@ -83,6 +83,30 @@ class TestSearchService:
 
         assert len(results) > 0
 
+    @respx.mock
+    async def test_search_forwards_limit(self, service: SearchService, search_results: dict):
+        """Test limit is sent to the API."""
+        route = respx.get("https://api.sejm.gov.pl/eli/acts/search").mock(
+            return_value=Response(200, json=search_results)
+        )
+
+        results, _, _ = await service.search(publisher="DU", limit=21)
+
+        assert route.calls.last.request.url.params["limit"] == "21"
+        assert len(results) == 3
+
+    @respx.mock
+    async def test_search_prefers_total_count(self, service: SearchService, search_results: dict):
+        """Test totalCount wins over the page-sized count when the API reports it."""
+        respx.get("https://api.sejm.gov.pl/eli/acts/search").mock(
+            return_value=Response(200, json={**search_results, "totalCount": 120})
+        )
+
+        results, total_count, _ = await service.search(publisher="DU", limit=21)
+
+        assert len(results) == 3
+        assert total_count == 120
+
     @respx.mock
     async def test_search_empty_results(self, service: SearchService):
         """Test search with empty results."""